@@ -1,6 +1,6 @@
 """AAS ingestion layer for loading and traversing Asset Administration Shells."""
 
-from aas_uns_bridge.aas.loader import load_aasx, load_json
-from aas_uns_bridge.aas.traversal import flatten_submodel
+from aas_uns_bridge.aas.loader import iter_aasx, load_aasx, load_json
+from aas_uns_bridge.aas.traversal import flatten_submodel, iter_submodel_metrics
 
-__all__ = ["load_aasx", "load_json", "flatten_submodel"]
+__all__ = ["iter_aasx", "load_aasx", "load_json", "flatten_submodel", "iter_submodel_metrics"]
@@ -0,0 +1,72 @@
+"""Content fingerprints for in-memory change detection.
+
+Fingerprints are only compared against earlier fingerprints from the same
+process, so they need not be cryptographic. When the optional ``xxhash``
+package is installed (``pip install aas-uns-bridge[xxhash]``) XXH3-128 is
+used; otherwise SHA-256, which is hardware-accelerated on most CPUs.
+
+Do not use these for values that are persisted, as the algorithm depends
+on the installed packages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+from pathlib import Path
+from typing import Any
+
+xxhash: Any | None
+try:
+    xxhash = importlib.import_module("xxhash")
+except ImportError:
+    xxhash = None
+
+# Bytes read per step when fingerprinting a file with xxhash
+_FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def is_xxhash_available() -> bool:
+    """Check if the xxhash package is available.
+
+    Returns:
+        True if xxhash can be imported, False otherwise.
+    """
+    return xxhash is not None
+
+
+def content_fingerprint(data: bytes) -> str:
+    """Compute a change-detection fingerprint of a byte string.
+
+    Args:
+        data: Content to fingerprint.
+
+    Returns:
+        Hex digest of the content.
+    """
+    if xxhash is not None:
+        return str(xxhash.xxh3_128_hexdigest(data))
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_fingerprint(path: Path) -> str:
+    """Compute a change-detection fingerprint of a file's content.
+
+    The file is read in chunks, so large files are never held in memory.
+
+    Args:
+        path: File to fingerprint.
+
+    Returns:
+        Hex digest of the file content, equal to ``content_fingerprint`` of
+        its bytes.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if xxhash is None:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        hasher = xxhash.xxh3_128()
+        buffer = bytearray(_FILE_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            hasher.update(view[:size])
+        return str(hasher.hexdigest())
@@ -1,11 +1,19 @@
-"""AAS file loaders for AASX packages and JSON files."""
+"""AAS file loaders for AASX packages and JSON files.
 
+When the optional ``ijson`` package is installed (``pip install
+aas-uns-bridge[streaming]``), JSON environments are decoded one top-level
+object at a time instead of materializing the whole document first.
+"""
+
+import importlib
 import json
 import logging
+import queue
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any, cast
+from typing import IO, Any, cast
 
 from basyx.aas import model
 from basyx.aas.adapter import aasx
@@ -15,6 +23,28 @@ from aas_uns_bridge.observability.metrics import METRICS
 
 logger = logging.getLogger(__name__)
 
+# Optional incremental JSON parser
+ijson: Any | None
+try:
+    ijson = importlib.import_module("ijson")
+except ImportError:
+    ijson = None
+
+# Bytes read per step when sniffing the top-level JSON value
+_SNIFF_CHUNK_SIZE = 512
+_JSON_WHITESPACE = b" \t\r\n"
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Seconds between checks for an abandoned consumer while handing off AASX objects
+_HANDOFF_POLL_SECONDS = 0.1
+
+# ijson prefixes of the top-level environment lists and their expected types
+_ENVIRONMENT_ITEMS: dict[str, type[model.Identifiable]] = {
+    "assetAdministrationShells.item": model.AssetAdministrationShell,
+    "submodels.item": model.Submodel,
+    "conceptDescriptions.item": model.concept.ConceptDescription,
+}
+
 
 class AASLoadError(Exception):
     """Raised when AAS content cannot be loaded."""
@@ -22,6 +52,211 @@ class AASLoadError(Exception):
     pass
 
 
+def _sniff_json_value(path: Path) -> bytes:
+    """Return the first byte of the top-level JSON value in a file.
+
+    Only the leading whitespace is read, so the format can be detected
+    without parsing the whole document.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        The opening byte (b"{" or b"[" for containers), or b"" if the
+        file contains only whitespace.
+    """
+    with open(path, "rb") as f:
+        chunk = f.read(_SNIFF_CHUNK_SIZE).removeprefix(_UTF8_BOM)
+        while chunk:
+            stripped = chunk.lstrip(_JSON_WHITESPACE)
+            if stripped:
+                return stripped[:1]
+            chunk = f.read(_SNIFF_CHUNK_SIZE)
+    return b""
+
+
+def is_streaming_available() -> bool:
+    """Check if incremental JSON parsing (ijson) is available.
+
+    Returns:
+        True if ijson can be imported, False otherwise.
+    """
+    return ijson is not None
+
+
+def _apply_object_hook(value: Any, hook: Callable[[dict[str, Any]], Any]) -> Any:
+    """Apply a JSON object hook bottom-up, as ``json.loads`` would."""
+    if isinstance(value, dict):
+        return hook({k: _apply_object_hook(v, hook) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_apply_object_hook(v, hook) for v in value]
+    return value
+
+
+def _iter_environment_items(fp: IO[bytes]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield each top-level list entry of an AAS environment as it is parsed.
+
+    Args:
+        fp: Binary file object positioned at the start of the JSON document.
+
+    Yields:
+        Tuples of (ijson prefix, raw JSON object).
+    """
+    assert ijson is not None
+    builder: Any = None
+    item_prefix = ""
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event == "end_map" and prefix == item_prefix:
+                yield item_prefix, builder.value
+                builder = None
+        elif event == "start_map" and prefix in _ENVIRONMENT_ITEMS:
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            item_prefix = prefix
+
+
+def _stream_environment_into(
+    object_store: model.DictObjectStore[model.Identifiable], path: Path
+) -> None:
+    """Decode an AAS JSON environment into an object store incrementally.
+
+    Mirrors the failsafe behavior of BaSyx's ``read_aas_json_file_into``:
+    objects that cannot be decoded, are not identifiable, or repeat an
+    identifier are logged and skipped.
+
+    Raises:
+        AASLoadError: If the document is not valid JSON.
+    """
+    assert ijson is not None
+    hook = aas_json.AASFromJsonDecoder.object_hook
+    with open(path, "rb") as fp:
+        if fp.read(len(_UTF8_BOM)) != _UTF8_BOM:
+            fp.seek(0)
+        try:
+            for prefix, raw in _iter_environment_items(fp):
+                item = _apply_object_hook(raw, hook)
+                if not isinstance(item, model.Identifiable):
+                    logger.error("Skipping undecodable entry in %s of %s", prefix, path.name)
+                    continue
+                if not isinstance(item, _ENVIRONMENT_ITEMS[prefix]):
+                    logger.warning("%s was in the wrong list in %s", item, path.name)
+                if object_store.get(item.id) is not None:
+                    logger.error("Skipping %s with duplicate identifier in %s", item, path.name)
+                    continue
+                object_store.add(item)
+        except ijson.JSONError as e:
+            raise AASLoadError(f"Invalid JSON in {path}: {e}") from e
+
+
+class _AASXConsumerGoneError(Exception):
+    """Raised in the AASX reader thread when the consumer stopped iterating."""
+
+
+class _ForwardingStore:
+    """Write-only object store that forwards added objects to a callback.
+
+    Implements just the part of the object store protocol that
+    ``AASXReader.read_into`` uses. Each object is forwarded when the next one
+    is added (or on :meth:`flush`), because the reader rewrites supplementary
+    file paths of an object right after adding it.
+    """
+
+    def __init__(self, emit: Callable[[model.Identifiable], None]) -> None:
+        self._emit = emit
+        self._ids: set[str] = set()
+        self._pending: model.Identifiable | None = None
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._ids
+
+    def add(self, obj: model.Identifiable) -> None:
+        self.flush()
+        self._ids.add(obj.id)
+        self._pending = obj
+
+    def flush(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._emit(pending)
+
+
+def iter_aasx(path: Path) -> Iterator[model.Identifiable]:
+    """Iterate over the AAS objects of an AASX package as they are read.
+
+    The package is read in a background thread and objects are handed over
+    one at a time, so callers that process and drop each object never hold
+    the whole package in memory. BaSyx still parses each AAS part as a whole,
+    so peak memory is bounded by the largest part rather than the package.
+
+    Args:
+        path: Path to the .aasx file.
+
+    Returns:
+        Iterator over each identifiable object in the package, duplicates
+        skipped.
+
+    Raises:
+        AASLoadError: If the file does not exist, or (while iterating) if
+            it cannot be parsed.
+    """
+    if not path.exists():
+        raise AASLoadError(f"AASX file not found: {path}")
+    return _stream_aasx(path)
+
+
+def _stream_aasx(path: Path) -> Iterator[model.Identifiable]:
+    """Generator behind :func:`iter_aasx`."""
+    handoff: queue.Queue[object] = queue.Queue(maxsize=1)
+    stopped = threading.Event()
+    done = object()
+
+    def emit(item: object) -> None:
+        while not stopped.is_set():
+            try:
+                handoff.put(item, timeout=_HANDOFF_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise _AASXConsumerGoneError
+
+    def read() -> None:
+        try:
+            try:
+                store = _ForwardingStore(emit)
+                file_store = aasx.DictSupplementaryFileContainer()  # type: ignore[no-untyped-call]
+                with aasx.AASXReader(str(path)) as reader:
+                    reader.read_into(cast(Any, store), file_store)
+                store.flush()
+            except _AASXConsumerGoneError:
+                raise
+            except Exception as e:
+                emit(AASLoadError(f"Failed to load AASX {path}: {e}"))
+                return
+            emit(done)
+        except _AASXConsumerGoneError:
+            pass
+
+    start_time = time.perf_counter()
+    count = 0
+    reader_thread = threading.Thread(target=read, name=f"aasx-reader-{path.name}", daemon=True)
+    reader_thread.start()
+    try:
+        while (item := handoff.get()) is not done:
+            if isinstance(item, AASLoadError):
+                raise item
+            count += 1
+            yield cast(model.Identifiable, item)
+    finally:
+        stopped.set()
+        reader_thread.join()
+
+    duration = time.perf_counter() - start_time
+    METRICS.aas_load_duration_seconds.labels(source_type="file").observe(duration)
+    logger.info("Streamed AASX: %s (%d objects)", path.name, count)
+
+
 def load_aasx(path: Path) -> model.DictObjectStore[model.Identifiable]:
     """Load an AASX package file.
 
@@ -68,8 +303,7 @@ def load_json(path: Path) -> model.DictObjectStore[model.Identifiable]:
 
     start_time = time.perf_counter()
     try:
-        with open(path) as f:
-            data = json.load(f)
+        opening = _sniff_json_value(path)
 
         object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
         read_aas_json_file_into = cast(
@@ -77,24 +311,22 @@ def load_json(path: Path) -> model.DictObjectStore[model.Identifiable]:
             aas_json.read_aas_json_file_into,  # type: ignore[attr-defined]
         )
 
-        # Handle both single-object and collection formats
-        if isinstance(data, dict):
-            if "assetAdministrationShells" in data or "submodels" in data:
-                # Environment format
-                read_aas_json_file_into(object_store, str(path))
-            else:
-                # Try as single object
-                read_aas_json_file_into(object_store, str(path))
-        elif isinstance(data, list):
-            # List of objects
-            read_aas_json_file_into(object_store, str(path))
-        else:
+        if opening not in (b"{", b"["):
             raise AASLoadError(f"Unexpected JSON structure in {path}")
 
+        if opening == b"{" and ijson is not None:
+            # Environment format, decoded object by object
+            _stream_environment_into(object_store, path)
+        else:
+            # BaSyx handles environments, single objects and lists alike
+            read_aas_json_file_into(object_store, str(path))
+
         duration = time.perf_counter() - start_time
         METRICS.aas_load_duration_seconds.labels(source_type="file").observe(duration)
         logger.info("Loaded JSON: %s (%d objects)", path.name, len(object_store))
         return object_store
+    except AASLoadError:
+        raise
     except json.JSONDecodeError as e:
         raise AASLoadError(f"Invalid JSON in {path}: {e}") from e
     except Exception as e:
@@ -1,19 +1,160 @@
 """REST client for AAS Repository API."""
 
+import asyncio
 import base64
-import hashlib
+import functools
+import importlib
+import importlib.util
 import json
 import logging
-from typing import Any, cast
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
 
 import httpx
 from basyx.aas import model
 from basyx.aas.adapter import json as aas_json
 
+from aas_uns_bridge.aas.fingerprint import content_fingerprint
 from aas_uns_bridge.config import RepoClientConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Optional fast JSON codec
+orjson: Any | None
+try:
+    orjson = importlib.import_module("orjson")
+except ImportError:
+    orjson = None
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body.
+
+    Uses orjson when installed (``pip install aas-uns-bridge[orjson]``),
+    falling back to the standard library for documents orjson rejects,
+    such as integers beyond 64 bits.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a value as a JSON request body (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return cast(bytes, orjson.dumps(value))
+        except TypeError:
+            pass
+    return json.dumps(value).encode()
+
+
+# Idle connections are kept across poll intervals instead of httpx's 5 s
+# default, so each poll or write does not pay for a new TCP/TLS handshake
+KEEPALIVE_EXPIRY_SECONDS = 300.0
+
+
+def pool_limits(connections: int) -> httpx.Limits:
+    """Pool limits allowing ``connections`` concurrent, long-lived connections."""
+    return httpx.Limits(
+        max_connections=connections,
+        max_keepalive_connections=connections,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+# The polling client's sync calls are issued one at a time from the daemon
+# loop, so a single kept-alive connection suffices
+SYNC_POOL_LIMITS = pool_limits(1)
+
+
+def _loop_running() -> bool:
+    """Return whether an event loop is running in the current thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def ensure_no_running_loop(method: str, async_method: str) -> None:
+    """Reject a synchronous wrapper call made from inside an event loop.
+
+    Args:
+        method: Name of the synchronous method being called.
+        async_method: Name of its coroutine counterpart.
+
+    Raises:
+        RuntimeError: If an event loop is running in the current thread.
+    """
+    if _loop_running():
+        raise RuntimeError(
+            f"{method}() cannot be called from a running event loop; await {async_method}() instead"
+        )
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Run awaitables concurrently, cancelling the rest if one fails.
+
+    Unlike ``asyncio.gather``, the remaining tasks are cancelled and awaited
+    before the first error propagates, so none of them outlives the caller's
+    HTTP client.
+
+    Returns:
+        Results in the order of the awaitables.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@functools.lru_cache(maxsize=4096)
+def encode_id(identifier: str) -> str:
+    """Base64URL encode an identifier for API paths.
+
+    Identifiers are reused on every poll and write, so results are memoized.
+    """
+    return base64.urlsafe_b64encode(identifier.encode()).decode().rstrip("=")
+
+
+def resolve_http2(requested: bool) -> bool:
+    """Decide whether an HTTP client can use HTTP/2.
+
+    HTTP/2 needs the optional ``h2`` package (``pip install
+    aas-uns-bridge[http2]``). If it was requested but is missing, a warning
+    is logged and HTTP/1.1 is used instead.
+
+    Args:
+        requested: Whether HTTP/2 was enabled in configuration.
+
+    Returns:
+        True if HTTP/2 should be enabled on the client.
+    """
+    if not requested:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+# Paths whose bodies are kept for reuse on 304 Not Modified
+_LISTING_PATHS = frozenset({"/shells", "/submodels"})
+
 
 class AASRepoClientError(Exception):
     """Raised when AAS Repository operations fail."""
@@ -34,19 +175,59 @@ class AASRepoClient:
         self.base_url = config.base_url.rstrip("/")
         self._etags: dict[str, str] = {}  # URL -> ETag for change detection
         self._hashes: dict[str, str] = {}  # URL -> content hash fallback
+        self._last_payload: dict[str, Any] = {}  # listing path -> body reused on 304
+        self._decoded: dict[str, model.Identifiable] = {}  # URL -> object reused if unchanged
+        self._listings: dict[str, tuple[float, list[dict[str, Any]]]] = {}  # path -> (time, list)
+        # Event loop and async client reused by fetch_all across polls
+        self._runner: asyncio.Runner | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._close_pending = False  # close() was called while fetch_all ran
 
         headers: dict[str, str] = {"Accept": "application/json"}
         if config.auth_token:
             headers["Authorization"] = f"Bearer {config.auth_token.get_secret_value()}"
 
+        self._headers = headers
+        self._http2 = resolve_http2(config.http2)
         self._client = httpx.Client(
             base_url=self.base_url,
             headers=headers,
             timeout=config.timeout_seconds,
+            http2=self._http2,
+            limits=SYNC_POOL_LIMITS,
+        )
+
+    def _make_async_client(self, concurrency: int) -> httpx.AsyncClient:
+        """Create an async HTTP client with a pool sized for ``concurrency``.
+
+        An async client is bound to the event loop that uses it. ``fetch_all``
+        keeps one for its own loop; ``afetch_all`` creates one per call.
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=self.config.timeout_seconds,
+            http2=self._http2,
+            limits=pool_limits(concurrency),
         )
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients and the event loop used by ``fetch_all``.
+
+        When called from inside a running ``fetch_all``, e.g. by a signal
+        handler, its loop cannot be re-entered; the close is then deferred
+        until ``fetch_all`` returns.
+        """
+        if self._runner is not None and _loop_running():
+            self._close_pending = True
+            return
+        self._close_pending = False
+        if self._runner is not None:
+            if self._async_client is not None:
+                self._runner.run(self._async_client.aclose())
+                self._async_client = None
+            self._runner.close()
+            self._runner = None
         self._client.close()
 
     def __enter__(self) -> "AASRepoClient":
@@ -55,23 +236,24 @@ class AASRepoClient:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def _encode_id(self, identifier: str) -> str:
-        """Base64URL encode an identifier for API paths."""
-        return base64.urlsafe_b64encode(identifier.encode()).decode().rstrip("=")
+    # Bound directly so each call is a single cached lookup
+    _encode_id = staticmethod(encode_id)
 
     def _compute_hash(self, content: bytes) -> str:
-        """Compute SHA256 hash of content."""
-        return hashlib.sha256(content).hexdigest()
+        """Compute a change-detection fingerprint of content."""
+        return content_fingerprint(content)
 
     def _has_changed(self, url: str, response: httpx.Response) -> bool:
-        """Check if content has changed since last fetch."""
-        # Check ETag first
-        etag = response.headers.get("ETag")
+        """Check if content has changed since last fetch.
+
+        The ETag is authoritative when the server sends one; the content is
+        only hashed for servers that do not.
+        """
+        etag: str | None = response.headers.get("ETag")
         if etag:
             old_etag = self._etags.get(url)
             self._etags[url] = etag
-            if old_etag and old_etag == etag:
-                return False
+            return etag != old_etag
 
         # Fall back to content hash
         content_hash = self._compute_hash(response.content)
@@ -79,6 +261,76 @@ class AASRepoClient:
         self._hashes[url] = content_hash
         return not (old_hash and old_hash == content_hash)
 
+    def _conditional_headers(self, url: str) -> dict[str, str]:
+        """Build If-None-Match headers for a URL with a known ETag.
+
+        A 304 answer carries no body, so the header is only sent while the
+        listing body or the decoded object of the URL is still held.
+        """
+        etag = self._etags.get(url)
+        if etag and (url in self._last_payload or url in self._decoded):
+            return {"If-None-Match": etag}
+        return {}
+
+    def _read_response(
+        self, url: str, response: httpx.Response, keep_payload: bool = False
+    ) -> tuple[Any, bool]:
+        """Return the JSON body of a response and whether it changed.
+
+        A 304 Not Modified answer to a conditional GET carries no body. For
+        listings the body kept from the previous fetch is returned instead;
+        for shells and submodels the body is None and the caller reuses the
+        decoded object.
+
+        Args:
+            url: Request path of the response.
+            response: The HTTP response.
+            keep_payload: Keep the body of ETag-tagged responses for reuse on 304.
+
+        Raises:
+            httpx.HTTPStatusError: If the response is an error status.
+        """
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            if url in self._last_payload:
+                return self._last_payload[url], False
+            if url in self._decoded:
+                return None, False
+        response.raise_for_status()
+        changed = self._has_changed(url, response)
+        data = decode_json(response.content)
+        if keep_payload and url in self._etags:
+            self._last_payload[url] = data
+        return data, changed
+
+    @staticmethod
+    def _parse_listing(data: Any) -> list[dict[str, Any]]:
+        """Extract descriptors from a plain or paged listing response."""
+        # Handle paged response format
+        if isinstance(data, dict) and "result" in data:
+            return cast(list[dict[str, Any]], data["result"])
+        return cast(list[dict[str, Any]], data) if isinstance(data, list) else []
+
+    def _cached_listing(self, path: str) -> list[dict[str, Any]] | None:
+        """Return a listing fetched within the descriptor cache TTL, if any."""
+        entry = self._listings.get(path)
+        if entry is None:
+            return None
+        fetched_at, listing = entry
+        if time.monotonic() - fetched_at >= self.config.descriptor_cache_ttl_seconds:
+            return None
+        return listing
+
+    def _store_listing(self, path: str, data: Any) -> list[dict[str, Any]]:
+        """Parse a listing response and remember it for the cache TTL."""
+        listing = self._parse_listing(data)
+        if self.config.descriptor_cache_ttl_seconds > 0:
+            self._listings[path] = (time.monotonic(), listing)
+        return listing
+
+    def invalidate_listings(self) -> None:
+        """Drop cached listings so the next fetch lists the repository again."""
+        self._listings.clear()
+
     def list_shells(self) -> list[dict[str, Any]]:
         """List all Asset Administration Shells in the repository.
 
@@ -88,14 +340,13 @@ class AASRepoClient:
         Raises:
             AASRepoClientError: If the request fails.
         """
+        cached = self._cached_listing("/shells")
+        if cached is not None:
+            return cached
         try:
-            response = self._client.get("/shells")
-            response.raise_for_status()
-            data = response.json()
-            # Handle paged response format
-            if isinstance(data, dict) and "result" in data:
-                return cast(list[dict[str, Any]], data["result"])
-            return cast(list[dict[str, Any]], data) if isinstance(data, list) else []
+            response = self._client.get("/shells", headers=self._conditional_headers("/shells"))
+            data, _ = self._read_response("/shells", response, keep_payload=True)
+            return self._store_listing("/shells", data)
         except httpx.HTTPError as e:
             raise AASRepoClientError(f"Failed to list shells: {e}") from e
 
@@ -113,11 +364,13 @@ class AASRepoClient:
         """
         url = f"/shells/{self._encode_id(aas_id)}"
         try:
+            # Unconditional: the caller needs the body, which is not kept
             response = self._client.get(url)
-            response.raise_for_status()
-            changed = self._has_changed(url, response)
-            return cast(dict[str, Any], response.json()), changed
+            data, changed = self._read_response(url, response)
+            return cast(dict[str, Any], data), changed
         except httpx.HTTPError as e:
+            # The object may have been deleted since the listing was cached
+            self.invalidate_listings()
             raise AASRepoClientError(f"Failed to get shell {aas_id}: {e}") from e
 
     def list_submodels(self) -> list[dict[str, Any]]:
@@ -129,13 +382,15 @@ class AASRepoClient:
         Raises:
             AASRepoClientError: If the request fails.
         """
+        cached = self._cached_listing("/submodels")
+        if cached is not None:
+            return cached
         try:
-            response = self._client.get("/submodels")
-            response.raise_for_status()
-            data = response.json()
-            if isinstance(data, dict) and "result" in data:
-                return cast(list[dict[str, Any]], data["result"])
-            return cast(list[dict[str, Any]], data) if isinstance(data, list) else []
+            response = self._client.get(
+                "/submodels", headers=self._conditional_headers("/submodels")
+            )
+            data, _ = self._read_response("/submodels", response, keep_payload=True)
+            return self._store_listing("/submodels", data)
         except httpx.HTTPError as e:
             raise AASRepoClientError(f"Failed to list submodels: {e}") from e
 
@@ -153,15 +408,91 @@ class AASRepoClient:
         """
         url = f"/submodels/{self._encode_id(submodel_id)}"
         try:
+            # Unconditional: the caller needs the body, which is not kept
             response = self._client.get(url)
-            response.raise_for_status()
-            changed = self._has_changed(url, response)
-            return cast(dict[str, Any], response.json()), changed
+            data, changed = self._read_response(url, response)
+            return cast(dict[str, Any], data), changed
         except httpx.HTTPError as e:
+            # The object may have been deleted since the listing was cached
+            self.invalidate_listings()
             raise AASRepoClientError(f"Failed to get submodel {submodel_id}: {e}") from e
 
-    def fetch_all(self) -> tuple[model.DictObjectStore[model.Identifiable], bool]:
-        """Fetch all AAS content from the repository.
+    async def _alist(self, client: httpx.AsyncClient, path: str, kind: str) -> list[dict[str, Any]]:
+        """List shells or submodels using the async client."""
+        cached = self._cached_listing(path)
+        if cached is not None:
+            return cached
+        try:
+            response = await client.get(path, headers=self._conditional_headers(path))
+            data, _ = self._read_response(path, response, keep_payload=True)
+            return self._store_listing(path, data)
+        except httpx.HTTPError as e:
+            raise AASRepoClientError(f"Failed to list {kind}: {e}") from e
+
+    async def _aget_shell(
+        self, client: httpx.AsyncClient, aas_id: str
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Async variant of ``get_shell``; the body is None on 304 Not Modified."""
+        url = f"/shells/{self._encode_id(aas_id)}"
+        try:
+            response = await client.get(url, headers=self._conditional_headers(url))
+            data, changed = self._read_response(url, response)
+            return cast(dict[str, Any] | None, data), changed
+        except httpx.HTTPError as e:
+            # The object may have been deleted since the listing was cached
+            self.invalidate_listings()
+            raise AASRepoClientError(f"Failed to get shell {aas_id}: {e}") from e
+
+    async def _aget_submodel(
+        self, client: httpx.AsyncClient, submodel_id: str
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Async variant of ``get_submodel``; the body is None on 304 Not Modified."""
+        url = f"/submodels/{self._encode_id(submodel_id)}"
+        try:
+            response = await client.get(url, headers=self._conditional_headers(url))
+            data, changed = self._read_response(url, response)
+            return cast(dict[str, Any] | None, data), changed
+        except httpx.HTTPError as e:
+            # The object may have been deleted since the listing was cached
+            self.invalidate_listings()
+            raise AASRepoClientError(f"Failed to get submodel {submodel_id}: {e}") from e
+
+    def _decode(
+        self,
+        data: dict[str, Any],
+        expected_type: type[model.Identifiable],
+        kind: str,
+        identifier: str,
+    ) -> model.Identifiable | None:
+        """Decode a shell or submodel payload into a BaSyx object.
+
+        Returns:
+            The decoded object, or None if it could not be decoded.
+        """
+        decoder_cls = getattr(aas_json, "StrictAASFromJsonDecoder", None)
+        if decoder_cls is None:
+            logger.warning("StrictAASFromJsonDecoder unavailable; skipping %s %s", kind, identifier)
+            return None
+        try:
+            obj = decoder_cls().decode(encode_json(data).decode())
+        except Exception as e:
+            logger.warning("Failed to decode %s %s: %s", kind, identifier, e)
+            return None
+        return obj if isinstance(obj, expected_type) else None
+
+    async def afetch_all(
+        self, concurrency: int | None = None
+    ) -> tuple[model.DictObjectStore[model.Identifiable], bool]:
+        """Fetch all AAS content from the repository with concurrent requests.
+
+        Both listings are requested together, then every shell and submodel
+        is fetched with at most ``concurrency`` requests in flight. The HTTP
+        connections are closed when the call returns; callers that poll from
+        synchronous code should use :meth:`fetch_all`, which keeps them open.
+
+        Args:
+            concurrency: Maximum in-flight requests. Defaults to
+                ``config.max_concurrent_requests``.
 
         Returns:
             Tuple of (ObjectStore with all content, any_changed flag).
@@ -169,52 +500,75 @@ class AASRepoClient:
         Raises:
             AASRepoClientError: If fetching fails.
         """
+        limit = concurrency or self.config.max_concurrent_requests
+        async with self._make_async_client(limit) as client:
+            return await self._afetch_all(client, limit)
+
+    async def _afetch_all_reusing_client(
+        self,
+    ) -> tuple[model.DictObjectStore[model.Identifiable], bool]:
+        """Fetch all content over the async client kept by ``fetch_all``."""
+        limit = self.config.max_concurrent_requests
+        if self._async_client is None:
+            self._async_client = self._make_async_client(limit)
+        return await self._afetch_all(self._async_client, limit)
+
+    async def _afetch_all(
+        self, client: httpx.AsyncClient, limit: int
+    ) -> tuple[model.DictObjectStore[model.Identifiable], bool]:
+        """Fetch and decode all content using the given async client."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(
+            fetch: Callable[
+                [httpx.AsyncClient, str], Awaitable[tuple[dict[str, Any] | None, bool]]
+            ],
+            identifier: str,
+        ) -> tuple[dict[str, Any] | None, bool]:
+            async with semaphore:
+                return await fetch(client, identifier)
+
+        shells, submodels = await gather_or_cancel(
+            self._alist(client, "/shells", "shells"),
+            self._alist(client, "/submodels", "submodels"),
+        )
+        shell_ids = [str(d["id"]) for d in shells if d.get("id")]
+        sm_ids = [str(d["id"]) for d in submodels if d.get("id")]
+
+        results = await gather_or_cancel(
+            *(bounded(self._aget_shell, shell_id) for shell_id in shell_ids),
+            *(bounded(self._aget_submodel, sm_id) for sm_id in sm_ids),
+        )
+
         object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
         any_changed = False
-
-        # Fetch all shells
-        shells = self.list_shells()
-        for shell_desc in shells:
-            shell_id = shell_desc.get("id")
-            if shell_id:
-                shell_data, changed = self.get_shell(shell_id)
-                any_changed = any_changed or changed
-                try:
-                    decoder_cls = getattr(aas_json, "StrictAASFromJsonDecoder", None)
-                    if decoder_cls is None:
-                        logger.warning(
-                            "StrictAASFromJsonDecoder unavailable; skipping shell %s",
-                            shell_id,
-                        )
-                        continue
-                    decoder = decoder_cls()
-                    aas = decoder.decode(json.dumps(shell_data))
-                    if isinstance(aas, model.AssetAdministrationShell):
-                        object_store.add(aas)
-                except Exception as e:
-                    logger.warning("Failed to decode shell %s: %s", shell_id, e)
-
-        # Fetch all submodels
-        submodels = self.list_submodels()
-        for sm_desc in submodels:
-            sm_id = sm_desc.get("id")
-            if sm_id:
-                sm_data, changed = self.get_submodel(sm_id)
-                any_changed = any_changed or changed
-                try:
-                    decoder_cls = getattr(aas_json, "StrictAASFromJsonDecoder", None)
-                    if decoder_cls is None:
-                        logger.warning(
-                            "StrictAASFromJsonDecoder unavailable; skipping submodel %s",
-                            sm_id,
-                        )
-                        continue
-                    decoder = decoder_cls()
-                    sm = decoder.decode(json.dumps(sm_data))
-                    if isinstance(sm, model.Submodel):
-                        object_store.add(sm)
-                except Exception as e:
-                    logger.warning("Failed to decode submodel %s: %s", sm_id, e)
+        fetched = zip(
+            [("shell", "/shells", model.AssetAdministrationShell, i) for i in shell_ids]
+            + [("submodel", "/submodels", model.Submodel, i) for i in sm_ids],
+            results,
+            strict=True,
+        )
+        decoded: dict[str, model.Identifiable] = {}
+        listed = set(_LISTING_PATHS)
+        for (kind, prefix, expected_type, identifier), (data, changed) in fetched:
+            any_changed = any_changed or changed
+            url = f"{prefix}/{self._encode_id(identifier)}"
+            listed.add(url)
+            # Unchanged payloads decode to the same object, so reuse it
+            obj = None if changed else self._decoded.get(url)
+            if obj is None and data is not None:
+                obj = self._decode(data, expected_type, kind, identifier)
+            if obj is None:
+                # Its ETag and hash are kept, so an unchanged payload that
+                # does not decode is not reported as a change on every poll
+                continue
+            decoded[url] = obj
+            object_store.add(obj)
+        self._decoded = decoded
+
+        # Forget change-detection state of objects no longer listed
+        self._etags = {url: etag for url, etag in self._etags.items() if url in listed}
+        self._hashes = {url: h for url, h in self._hashes.items() if url in listed}
 
         logger.info(
             "Fetched from repository: %d objects (changed: %s)",
@@ -222,3 +576,28 @@ class AASRepoClient:
             any_changed,
         )
         return object_store, any_changed
+
+    def fetch_all(self) -> tuple[model.DictObjectStore[model.Identifiable], bool]:
+        """Fetch all AAS content from the repository.
+
+        Synchronous counterpart of :meth:`afetch_all`. The event loop and its
+        HTTP connections are kept between calls, so successive polls reuse
+        them; they are released by :meth:`close`. Must not be called from
+        async code (use :meth:`afetch_all` there) or from several threads at
+        once.
+
+        Returns:
+            Tuple of (ObjectStore with all content, any_changed flag).
+
+        Raises:
+            AASRepoClientError: If fetching fails.
+            RuntimeError: If called while an event loop is running in this thread.
+        """
+        ensure_no_running_loop("fetch_all", "afetch_all")
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        try:
+            return self._runner.run(self._afetch_all_reusing_client())
+        finally:
+            if self._close_pending:
+                self.close()
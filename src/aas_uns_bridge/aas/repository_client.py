@@ -7,24 +7,100 @@ between MQTT and AAS.
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import functools
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Sequence
 from functools import wraps
 from typing import Any, TypeVar
 
 import httpx
 
+from aas_uns_bridge.aas.repo_client import (
+    decode_json,
+    encode_id,
+    encode_json,
+    ensure_no_running_loop,
+    gather_or_cancel,
+    pool_limits,
+    resolve_http2,
+)
 from aas_uns_bridge.observability.metrics import METRICS
 
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
+AF = TypeVar("AF", bound=Callable[..., Awaitable[Any]])
 
 # HTTP status codes that indicate transient errors worth retrying
 # 429: Too Many Requests, 5xx: Server errors
-RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+# DotAAS Part 2 API path templates
+_ELEMENT_PATH = "/submodels/{}/submodel-elements/{}"
+_VALUE_PATH = _ELEMENT_PATH + "/$value"
+
+
+@functools.lru_cache(maxsize=4096)
+def _element_url(submodel_id: str, element_path: str) -> str:
+    """Build the API path of a submodel element (memoized)."""
+    return _ELEMENT_PATH.format(encode_id(submodel_id), element_path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _value_url(submodel_id: str, property_path: str) -> str:
+    """Build the API path of a property's $value endpoint (memoized)."""
+    return _VALUE_PATH.format(encode_id(submodel_id), property_path)
+
+
+def _should_retry(error: AasWriteError) -> bool:
+    """Classify a failed write attempt and record it.
+
+    Client errors (4xx other than 429) will always fail and are not retried.
+
+    Args:
+        error: The error raised by the attempt.
+
+    Returns:
+        True if the write should be retried.
+    """
+    if error.status_code and error.status_code not in RETRYABLE_STATUS_CODES:
+        logger.warning(
+            "AAS write failed with non-retryable status %d: %s",
+            error.status_code,
+            error,
+        )
+        return False
+    METRICS.aas_write_retries_total.inc()
+    return True
+
+
+def _backoff_delay(
+    error: AasWriteError, attempt: int, max_retries: int, base_delay: float, max_delay: float
+) -> float:
+    """Compute and log the delay before retrying a failed attempt.
+
+    Args:
+        error: The error raised by the attempt.
+        attempt: 1-based number of the attempt that failed.
+        max_retries: Maximum number of attempts.
+        base_delay: Initial delay between retries in seconds.
+        max_delay: Maximum delay between retries in seconds.
+
+    Returns:
+        Delay in seconds.
+    """
+    delay = min(base_delay * 2.0 ** (attempt - 1), max_delay)
+    logger.warning(
+        "AAS write failed (attempt %d/%d), retrying in %.1fs: %s",
+        attempt,
+        max_retries,
+        delay,
+        error,
+    )
+    return delay
 
 
 def retry_with_backoff(
@@ -49,34 +125,67 @@ def retry_with_backoff(
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception: Exception | None = None
-            for attempt in range(max_retries):
+            # Fast path: most writes succeed on the first attempt
+            try:
+                return func(*args, **kwargs)
+            except AasWriteError as e:
+                if not _should_retry(e):
+                    raise
+                error = e
+
+            for attempt in range(1, max_retries):
+                time.sleep(_backoff_delay(error, attempt, max_retries, base_delay, max_delay))
                 try:
                     return func(*args, **kwargs)
                 except AasWriteError as e:
-                    last_exception = e
-
-                    # Don't retry client errors (4xx) - they will always fail
-                    if e.status_code and e.status_code not in RETRYABLE_STATUS_CODES:
-                        logger.warning(
-                            "AAS write failed with non-retryable status %d: %s",
-                            e.status_code,
-                            e,
-                        )
+                    if not _should_retry(e):
                         raise
+                    error = e
+            raise error
 
-                    METRICS.aas_write_retries_total.inc()
-                    if attempt < max_retries - 1:
-                        delay = min(base_delay * (2**attempt), max_delay)
-                        logger.warning(
-                            "AAS write failed (attempt %d/%d), retrying in %.1fs: %s",
-                            attempt + 1,
-                            max_retries,
-                            delay,
-                            e,
-                        )
-                        time.sleep(delay)
-            raise last_exception  # type: ignore[misc]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def async_retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> Callable[[AF], AF]:
+    """Async variant of :func:`retry_with_backoff` using ``asyncio.sleep``.
+
+    Args:
+        max_retries: Maximum number of retry attempts.
+        base_delay: Initial delay between retries in seconds.
+        max_delay: Maximum delay between retries in seconds.
+
+    Returns:
+        Decorated coroutine function that retries on transient AasWriteError.
+    """
+
+    def decorator(func: AF) -> AF:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Fast path: most writes succeed on the first attempt
+            try:
+                return await func(*args, **kwargs)
+            except AasWriteError as e:
+                if not _should_retry(e):
+                    raise
+                error = e
+
+            for attempt in range(1, max_retries):
+                await asyncio.sleep(
+                    _backoff_delay(error, attempt, max_retries, base_delay, max_delay)
+                )
+                try:
+                    return await func(*args, **kwargs)
+                except AasWriteError as e:
+                    if not _should_retry(e):
+                        raise
+                    error = e
+            raise error
 
         return wrapper  # type: ignore[return-value]
 
@@ -103,6 +212,8 @@ class AasRepositoryClient:
         base_url: str,
         auth_token: str | None = None,
         timeout: float = 30.0,
+        http2: bool = False,
+        max_connections: int = 8,
     ):
         """Initialize the repository client.
 
@@ -110,6 +221,9 @@ class AasRepositoryClient:
             base_url: Base URL of the AAS repository.
             auth_token: Optional bearer token for authentication.
             timeout: Request timeout in seconds.
+            http2: Multiplex requests over HTTP/2 (requires the ``h2`` package).
+            max_connections: Connections kept for synchronous calls, which
+                command handlers may issue from several threads at once.
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
@@ -121,10 +235,24 @@ class AasRepositoryClient:
         if auth_token:
             headers["Authorization"] = f"Bearer {auth_token}"
 
+        self._headers = headers
+        self._http2 = resolve_http2(http2)
         self._client = httpx.Client(
             base_url=self._base_url,
             headers=headers,
             timeout=timeout,
+            http2=self._http2,
+            limits=pool_limits(max_connections),
+        )
+
+    def _make_async_client(self, concurrency: int) -> httpx.AsyncClient:
+        """Create an async HTTP client for one batch of writes."""
+        return httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._headers,
+            timeout=self._timeout,
+            http2=self._http2,
+            limits=pool_limits(concurrency),
         )
 
     def close(self) -> None:
@@ -137,9 +265,8 @@ class AasRepositoryClient:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def _encode_id(self, identifier: str) -> str:
-        """Base64URL encode an identifier for API paths."""
-        return base64.urlsafe_b64encode(identifier.encode()).decode().rstrip("=")
+    # Bound directly so each call is a single cached lookup
+    _encode_id = staticmethod(encode_id)
 
     @retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=30.0)
     def update_property(
@@ -160,11 +287,10 @@ class AasRepositoryClient:
         Raises:
             AasWriteError: If the update fails.
         """
-        encoded_id = self._encode_id(submodel_id)
-        url = f"/submodels/{encoded_id}/submodel-elements/{property_path}/$value"
+        url = _value_url(submodel_id, property_path)
 
         try:
-            response = self._client.patch(url, json=value)
+            response = self._client.patch(url, content=encode_json(value))
             response.raise_for_status()
             logger.debug("Updated %s/%s to %s", submodel_id, property_path, value)
         except httpx.HTTPStatusError as e:
@@ -175,6 +301,82 @@ class AasRepositoryClient:
         except httpx.HTTPError as e:
             raise AasWriteError(f"Failed to update {property_path}: {e}") from e
 
+    @async_retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=30.0)
+    async def _aupdate_property(
+        self,
+        client: httpx.AsyncClient,
+        submodel_id: str,
+        property_path: str,
+        value: Any,
+    ) -> None:
+        """Async variant of ``update_property`` on a shared client."""
+        url = _value_url(submodel_id, property_path)
+
+        try:
+            response = await client.patch(url, content=encode_json(value))
+            response.raise_for_status()
+            logger.debug("Updated %s/%s to %s", submodel_id, property_path, value)
+        except httpx.HTTPStatusError as e:
+            raise AasWriteError(
+                f"Failed to update {property_path}: {e.response.text}",
+                status_code=e.response.status_code,
+            ) from e
+        except httpx.HTTPError as e:
+            raise AasWriteError(f"Failed to update {property_path}: {e}") from e
+
+    async def aupdate_properties(
+        self,
+        updates: Sequence[tuple[str, str, Any]],
+        concurrency: int = 32,
+    ) -> list[AasWriteError | None]:
+        """Write many property values concurrently.
+
+        Each update is retried independently with the same policy as
+        ``update_property``; a failed write does not cancel the others.
+
+        Args:
+            updates: Tuples of (submodel_id, property_path, value).
+            concurrency: Maximum number of writes in flight.
+
+        Returns:
+            One entry per update, in order: None on success, or the
+            AasWriteError that made it fail.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with self._make_async_client(concurrency) as client:
+
+            async def write(
+                submodel_id: str, property_path: str, value: Any
+            ) -> AasWriteError | None:
+                async with semaphore:
+                    try:
+                        await self._aupdate_property(client, submodel_id, property_path, value)
+                    except AasWriteError as e:
+                        return e
+                    return None
+
+            return await gather_or_cancel(*(write(*update) for update in updates))
+
+    def update_properties_batch(
+        self,
+        updates: Sequence[tuple[str, str, Any]],
+        concurrency: int = 32,
+    ) -> list[AasWriteError | None]:
+        """Write many property values concurrently (synchronous wrapper).
+
+        Each call runs its own short-lived event loop, so batches may be
+        written from several threads at once. Must not be called from async
+        code; await :meth:`aupdate_properties` there instead.
+
+        See :meth:`aupdate_properties`.
+
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread.
+        """
+        ensure_no_running_loop("update_properties_batch", "aupdate_properties")
+        return asyncio.run(self.aupdate_properties(updates, concurrency))
+
     def get_property(
         self,
         submodel_id: str,
@@ -192,13 +394,12 @@ class AasRepositoryClient:
         Raises:
             AasWriteError: If the read fails.
         """
-        encoded_id = self._encode_id(submodel_id)
-        url = f"/submodels/{encoded_id}/submodel-elements/{property_path}/$value"
+        url = _value_url(submodel_id, property_path)
 
         try:
             response = self._client.get(url)
             response.raise_for_status()
-            return response.json()
+            return decode_json(response.content)
         except httpx.HTTPStatusError as e:
             raise AasWriteError(
                 f"Failed to read {property_path}: {e.response.text}",
@@ -224,13 +425,12 @@ class AasRepositoryClient:
         Raises:
             AasWriteError: If the read fails.
         """
-        encoded_id = self._encode_id(submodel_id)
-        url = f"/submodels/{encoded_id}/submodel-elements/{element_path}"
+        url = _element_url(submodel_id, element_path)
 
         try:
             response = self._client.get(url)
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = decode_json(response.content)
             return result
         except httpx.HTTPStatusError as e:
             raise AasWriteError(
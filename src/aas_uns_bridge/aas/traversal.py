@@ -1,9 +1,11 @@
-"""Recursive traversal of AAS submodels to flatten elements into metrics."""
+"""Traversal of AAS submodels to flatten elements into metrics."""
 
+import functools
 import logging
 import time
-from collections.abc import Iterator
-from typing import Any
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, cast
 
 from basyx.aas import model
 
@@ -12,6 +14,9 @@ from aas_uns_bridge.observability.metrics import METRICS
 
 logger = logging.getLogger(__name__)
 
+# Bound once; flatten_submodel runs for every submodel on every poll
+_observe_traversal = METRICS.traversal_duration_seconds.observe
+
 
 def _extract_semantic_references(element: model.HasSemantics) -> tuple[str, ...]:
     """Extract ALL semantic keys from an element.
@@ -28,9 +33,11 @@ def _extract_semantic_references(element: model.HasSemantics) -> tuple[str, ...]
     """
     if element.semantic_id is None:
         return ()
-    keys = list(element.semantic_id.key)
-    if not keys:
-        return ()
+    keys = element.semantic_id.key
+    if len(keys) == 1:
+        # Most references have a single key
+        value = keys[0].value
+        return () if value is None else (str(value),)
     return tuple(str(k.value) for k in keys if k.value is not None)
 
 
@@ -50,57 +57,70 @@ def _extract_semantic_id(element: model.HasSemantics) -> str | None:
     return keys[0] if keys else None
 
 
+# Whether instances of a type carry embedded data specifications, probed once per type
+_HAS_DATA_SPECIFICATIONS: dict[type, bool] = {}
+
+
 def _extract_unit(element: model.HasDataSpecification) -> str | None:
     """Extract unit from DataSpecificationIEC61360 if present."""
-    if not hasattr(element, "embedded_data_specifications"):
+    element_type = type(element)
+    has_specs = _HAS_DATA_SPECIFICATIONS.get(element_type)
+    if has_specs is None:
+        has_specs = hasattr(element, "embedded_data_specifications")
+        _HAS_DATA_SPECIFICATIONS[element_type] = has_specs
+    if not has_specs or not element.embedded_data_specifications:
         return None
 
-    for spec in element.embedded_data_specifications or []:
+    for spec in element.embedded_data_specifications:
         content = spec.data_specification_content
         if hasattr(content, "unit") and content.unit:
             return str(content.unit)
     return None
 
 
+# Mapping of Python types to XSD type strings
+_PYTHON_XSD_TYPES: dict[type, str] = {
+    str: "xs:string",
+    int: "xs:int",
+    float: "xs:double",
+    bool: "xs:boolean",
+    bytes: "xs:base64Binary",
+}
+
+# Mapping of common BaSyx datatype names to XSD type strings
+_BASYX_XSD_TYPES: dict[str, str] = {
+    "Double": "xs:double",
+    "Float": "xs:float",
+    "Int": "xs:int",
+    "Long": "xs:long",
+    "Short": "xs:short",
+    "Byte": "xs:byte",
+    "String": "xs:string",
+    "NormalizedString": "xs:string",
+    "AnyURI": "xs:anyURI",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _xsd_type_for(value_type: type) -> str:
+    """Map a BaSyx value type to its XSD type string (memoized)."""
+    # Check if it's a Python type
+    if value_type in _PYTHON_XSD_TYPES:
+        return _PYTHON_XSD_TYPES[value_type]
+    # Check for BaSyx specific types
+    type_name = getattr(value_type, "__name__", str(value_type))
+    return _BASYX_XSD_TYPES.get(type_name, f"xs:{type_name.lower()}")
+
+
 def _get_value_type(element: model.SubmodelElement) -> str:
     """Get the XSD value type string for an element.
 
     BaSyx v2.0 uses Python types directly (str, int, float, etc.)
     instead of an enum, so we map them to XSD type strings.
     """
-    # Mapping of Python types to XSD type strings
-    type_map = {
-        str: "xs:string",
-        int: "xs:int",
-        float: "xs:double",
-        bool: "xs:boolean",
-        bytes: "xs:base64Binary",
-    }
-
-    value_type = None
-    if isinstance(element, (model.Property, model.Range)):
-        value_type = element.value_type
-
-    if value_type is not None:
-        # Check if it's a Python type
-        if value_type in type_map:
-            return type_map[value_type]
-        # Check for BaSyx specific types
-        type_name = getattr(value_type, "__name__", str(value_type))
-        # Map common BaSyx datatypes
-        basyx_map = {
-            "Double": "xs:double",
-            "Float": "xs:float",
-            "Int": "xs:int",
-            "Long": "xs:long",
-            "Short": "xs:short",
-            "Byte": "xs:byte",
-            "String": "xs:string",
-            "NormalizedString": "xs:string",
-            "AnyURI": "xs:anyURI",
-        }
-        return basyx_map.get(type_name, f"xs:{type_name.lower()}")
-
+    if isinstance(element, (model.Property, model.Range)) and element.value_type is not None:
+        # Value types are classes, which are always hashable
+        return _xsd_type_for(cast(type, element.value_type))
     return "xs:string"
 
 
@@ -109,14 +129,15 @@ def _get_value(element: model.SubmodelElement, preferred_lang: str = "en") -> An
     if isinstance(element, model.Property):
         return element.value
     elif isinstance(element, model.MultiLanguageProperty):
-        if element.value:
+        texts = element.value
+        if texts:
             # BaSyx v2.0 uses MultiLanguageTextType which is dict-like
-            # Try preferred language first
-            if preferred_lang in element.value:
-                return element.value[preferred_lang]
-            # Fall back to first available
-            for _lang, text in element.value.items():
+            # Try preferred language first (texts are never None)
+            text = texts.get(preferred_lang)
+            if text is not None:
                 return text
+            # Fall back to first available
+            return next(iter(texts.values()), None)
         return None
     elif isinstance(element, model.Range):
         # Return as dict for range values
@@ -128,294 +149,401 @@ def _ref_to_string(ref: model.Reference | None) -> str | None:
     """Convert an AAS Reference to a slash-separated string."""
     if ref is None or not ref.key:
         return None
-    return "/".join(str(k.value) for k in ref.key)
+    keys = ref.key
+    if len(keys) == 1:
+        return str(keys[0].value)
+    return "/".join([str(k.value) for k in keys])
 
 
-def _flatten_element(
-    element: model.SubmodelElement,
-    path_prefix: str,
-    aas_source: str,
-    timestamp_ms: int,
-    preferred_lang: str,
-    submodel_semantic_id: str | None = None,
-) -> Iterator[ContextMetric]:
-    """Recursively flatten a submodel element into metrics.
+@dataclass(slots=True)
+class _FlattenState:
+    """Per-call state shared by the element handlers."""
 
-    Args:
-        element: The submodel element to process.
-        path_prefix: Dot-separated path to this element.
-        aas_source: Source identifier (file path or URL).
-        timestamp_ms: Extraction timestamp.
-        preferred_lang: Preferred language for MultiLanguageProperty.
-        submodel_semantic_id: Semantic ID of the parent submodel.
+    aas_source: str
+    timestamp_ms: int
+    preferred_lang: str
+    submodel_semantic_id: str | None
+    metrics: list[ContextMetric] = field(default_factory=list)
+    # (element, parent path) pairs still to be visited
+    stack: list[tuple[model.SubmodelElement, str]] = field(default_factory=list)
 
-    Yields:
-        ContextMetric for each leaf element.
-    """
-    id_short = element.id_short or "unnamed"
-    current_path = f"{path_prefix}.{id_short}" if path_prefix else id_short
 
-    # Skip File and Blob types as per requirements
-    if isinstance(element, (model.File, model.Blob)):
-        logger.debug("Skipping File/Blob element: %s", current_path)
-        return
+_Handler = Callable[[Any, str, _FlattenState], None]
 
-    # Handle collections recursively
-    if isinstance(element, model.SubmodelElementCollection):
-        for child in element.value or []:
-            yield from _flatten_element(
-                child,
-                current_path,
-                aas_source,
-                timestamp_ms,
-                preferred_lang,
-                submodel_semantic_id,
-            )
-        return
 
-    # Handle lists with index-based paths
-    if isinstance(element, model.SubmodelElementList):
-        for idx, child in enumerate(element.value or []):
-            indexed_path = f"{current_path}[{idx}]"
-            # For list items, we process them but use the indexed path
-            if isinstance(child, (model.SubmodelElementCollection, model.SubmodelElementList)):
-                # Nested structure in list
-                for nested in child.value or []:
-                    yield from _flatten_element(
-                        nested,
-                        indexed_path,
-                        aas_source,
-                        timestamp_ms,
-                        preferred_lang,
-                        submodel_semantic_id,
-                    )
-            else:
-                # Leaf element in list
-                yield from _flatten_leaf(
-                    child,
-                    indexed_path,
-                    aas_source,
-                    timestamp_ms,
-                    preferred_lang,
-                    submodel_semantic_id,
-                )
+def _log_skipped(element: model.SubmodelElement, path: str) -> None:
+    """Log a skipped File/Blob element at debug level."""
+    if logger.isEnabledFor(logging.DEBUG):
+        id_short = element.id_short or "unnamed"
+        logger.debug("Skipping File/Blob element: %s", f"{path}.{id_short}" if path else id_short)
+
+
+def _handle_collection(
+    element: model.SubmodelElementCollection, current_path: str, state: _FlattenState
+) -> None:
+    """Descend into the children of a collection."""
+    children = [(child, current_path) for child in element.value or []]
+    children.reverse()
+    state.stack.extend(children)
+
+
+def _handle_list(
+    element: model.SubmodelElementList[Any], current_path: str, state: _FlattenState
+) -> None:
+    """Handle a list with index-based paths.
+
+    BaSyx guarantees every item is a ``type_value_list_element`` (AASd-108),
+    so one subclass check decides between descending and emitting leaves.
+    """
+    children = element.value
+    if not children:
+        return
+    prefix = current_path + "["
+
+    if not issubclass(
+        element.type_value_list_element,
+        (model.SubmodelElementCollection, model.SubmodelElementList),
+    ):
+        # Leaf items have nothing to descend into, so emit them in order now
+        for idx, child in enumerate(children):
+            _emit_leaf(child, f"{prefix}{idx}]", state)
         return
 
-    # Handle Range specially - emit min and max as separate metrics
-    if isinstance(element, model.Range):
-        semantic_keys = _extract_semantic_references(element)
-        semantic_id = semantic_keys[0] if semantic_keys else None
-        unit = _extract_unit(element)
-        value_type = _get_value_type(element)
+    # Nested structures in list: descend with the indexed path as prefix
+    items: list[tuple[model.SubmodelElement, str]] = []
+    for idx, child in enumerate(children):
+        indexed_path = f"{prefix}{idx}]"
+        items.extend((nested, indexed_path) for nested in child.value or [])
+    items.reverse()
+    state.stack.extend(items)
+
 
-        if element.min is not None:
-            yield ContextMetric(
+def _emit_range(element: model.Range, current_path: str, state: _FlattenState) -> None:
+    """Emit min and max of a Range as separate metrics."""
+    semantic_keys = _extract_semantic_references(element)
+    semantic_id = semantic_keys[0] if semantic_keys else None
+    unit = _extract_unit(element)
+    value_type = _get_value_type(element)
+
+    if element.min is not None:
+        state.metrics.append(
+            ContextMetric(
                 path=f"{current_path}.min",
                 value=element.min,
                 aas_type="Range.min",
                 value_type=value_type,
                 semantic_id=semantic_id,
                 unit=unit,
-                aas_source=aas_source,
-                timestamp_ms=timestamp_ms,
+                aas_source=state.aas_source,
+                timestamp_ms=state.timestamp_ms,
                 semantic_keys=semantic_keys,
-                submodel_semantic_id=submodel_semantic_id,
+                submodel_semantic_id=state.submodel_semantic_id,
             )
-        if element.max is not None:
-            yield ContextMetric(
+        )
+    if element.max is not None:
+        state.metrics.append(
+            ContextMetric(
                 path=f"{current_path}.max",
                 value=element.max,
                 aas_type="Range.max",
                 value_type=value_type,
                 semantic_id=semantic_id,
                 unit=unit,
-                aas_source=aas_source,
-                timestamp_ms=timestamp_ms,
+                aas_source=state.aas_source,
+                timestamp_ms=state.timestamp_ms,
                 semantic_keys=semantic_keys,
-                submodel_semantic_id=submodel_semantic_id,
+                submodel_semantic_id=state.submodel_semantic_id,
             )
-        return
+        )
 
-    # Handle ReferenceElement - extract reference target as string
-    if isinstance(element, model.ReferenceElement):
-        ref_value = None
-        if element.value and element.value.key:
-            ref_value = "/".join(str(k.value) for k in element.value.key)
-        semantic_keys = _extract_semantic_references(element)
-        semantic_id = semantic_keys[0] if semantic_keys else None
-        unit = _extract_unit(element)
-        yield ContextMetric(
+
+def _emit_reference(
+    element: model.ReferenceElement, current_path: str, state: _FlattenState
+) -> None:
+    """Emit the reference target of a ReferenceElement as a string."""
+    ref_value = _ref_to_string(element.value)
+    semantic_keys = _extract_semantic_references(element)
+    semantic_id = semantic_keys[0] if semantic_keys else None
+    unit = _extract_unit(element)
+    state.metrics.append(
+        ContextMetric(
             path=current_path,
             value=ref_value,
             aas_type="ReferenceElement",
             value_type="xs:string",
             semantic_id=semantic_id,
             unit=unit,
-            aas_source=aas_source,
-            timestamp_ms=timestamp_ms,
+            aas_source=state.aas_source,
+            timestamp_ms=state.timestamp_ms,
             semantic_keys=semantic_keys,
-            submodel_semantic_id=submodel_semantic_id,
+            submodel_semantic_id=state.submodel_semantic_id,
         )
-        return
+    )
 
-    # Handle Entity - publish entity type, global asset ID, and recurse into statements
-    if isinstance(element, model.Entity):
-        semantic_keys = _extract_semantic_references(element)
-        semantic_id = semantic_keys[0] if semantic_keys else None
-        unit = _extract_unit(element)
 
-        # Publish entity type
-        entity_type_name = element.entity_type.name if element.entity_type else "SELF_MANAGED"
-        yield ContextMetric(
+def _handle_entity(element: model.Entity, current_path: str, state: _FlattenState) -> None:
+    """Emit entity type and global asset ID, then descend into statements."""
+    semantic_keys = _extract_semantic_references(element)
+    semantic_id = semantic_keys[0] if semantic_keys else None
+    unit = _extract_unit(element)
+
+    # Publish entity type
+    entity_type_name = element.entity_type.name if element.entity_type else "SELF_MANAGED"
+    state.metrics.append(
+        ContextMetric(
             path=f"{current_path}.entityType",
             value=entity_type_name,
             aas_type="Entity.entityType",
             value_type="xs:string",
             semantic_id=semantic_id,
             unit=unit,
-            aas_source=aas_source,
-            timestamp_ms=timestamp_ms,
+            aas_source=state.aas_source,
+            timestamp_ms=state.timestamp_ms,
             semantic_keys=semantic_keys,
-            submodel_semantic_id=submodel_semantic_id,
+            submodel_semantic_id=state.submodel_semantic_id,
         )
+    )
 
-        # Publish global asset ID if present
-        if element.global_asset_id:
-            yield ContextMetric(
+    # Publish global asset ID if present
+    if element.global_asset_id:
+        state.metrics.append(
+            ContextMetric(
                 path=f"{current_path}.globalAssetId",
                 value=element.global_asset_id,
                 aas_type="Entity.globalAssetId",
                 value_type="xs:string",
                 semantic_id=semantic_id,
                 unit=unit,
-                aas_source=aas_source,
-                timestamp_ms=timestamp_ms,
+                aas_source=state.aas_source,
+                timestamp_ms=state.timestamp_ms,
                 semantic_keys=semantic_keys,
-                submodel_semantic_id=submodel_semantic_id,
+                submodel_semantic_id=state.submodel_semantic_id,
             )
+        )
+
+    # Descend into statements (SubmodelElements) under the entity's path
+    if element.statement:
+        statements = [(stmt, current_path) for stmt in element.statement]
+        statements.reverse()
+        state.stack.extend(statements)
 
-        # Recurse into statements (SubmodelElements)
-        # Pass current_path as prefix; _flatten_element will append stmt.id_short
-        if element.statement:
-            for stmt in element.statement:
-                yield from _flatten_element(
-                    stmt,
-                    current_path,
-                    aas_source,
-                    timestamp_ms,
-                    preferred_lang,
-                    submodel_semantic_id,
-                )
-        return
 
-    # Handle RelationshipElement - publish first/second references
-    if isinstance(element, model.RelationshipElement):
-        first_ref = _ref_to_string(element.first) if element.first else None
-        second_ref = _ref_to_string(element.second) if element.second else None
-        relationship_value = f"{first_ref or ''} -> {second_ref or ''}"
+def _emit_relationship(
+    element: model.RelationshipElement, current_path: str, state: _FlattenState
+) -> None:
+    """Emit the first/second references of a RelationshipElement."""
+    first_ref = _ref_to_string(element.first) if element.first else None
+    second_ref = _ref_to_string(element.second) if element.second else None
+    relationship_value = f"{first_ref or ''} -> {second_ref or ''}"
 
-        semantic_keys = _extract_semantic_references(element)
-        semantic_id = semantic_keys[0] if semantic_keys else None
-        unit = _extract_unit(element)
+    semantic_keys = _extract_semantic_references(element)
+    semantic_id = semantic_keys[0] if semantic_keys else None
+    unit = _extract_unit(element)
 
-        yield ContextMetric(
+    state.metrics.append(
+        ContextMetric(
             path=current_path,
             value=relationship_value,
             aas_type="RelationshipElement",
             value_type="xs:string",
             semantic_id=semantic_id,
             unit=unit,
-            aas_source=aas_source,
-            timestamp_ms=timestamp_ms,
+            aas_source=state.aas_source,
+            timestamp_ms=state.timestamp_ms,
             semantic_keys=semantic_keys,
-            submodel_semantic_id=submodel_semantic_id,
+            submodel_semantic_id=state.submodel_semantic_id,
         )
-        return
+    )
+
 
-    # Handle leaf elements (Property, MultiLanguageProperty, etc.)
-    yield from _flatten_leaf(
-        element,
-        current_path,
-        aas_source,
-        timestamp_ms,
-        preferred_lang,
-        submodel_semantic_id,
+def _emit_leaf(element: model.SubmodelElement, path: str, state: _FlattenState) -> None:
+    """Emit a leaf element (Property, MultiLanguageProperty, etc.)."""
+    semantic_keys = _extract_semantic_references(element)
+    state.metrics.append(
+        ContextMetric(
+            path=path,
+            value=_get_value(element, state.preferred_lang),
+            aas_type=type(element).__name__,
+            value_type=_get_value_type(element),
+            semantic_id=semantic_keys[0] if semantic_keys else None,
+            unit=_extract_unit(element),
+            aas_source=state.aas_source,
+            timestamp_ms=state.timestamp_ms,
+            semantic_keys=semantic_keys,
+            submodel_semantic_id=state.submodel_semantic_id,
+        )
     )
 
 
-def _flatten_leaf(
-    element: model.SubmodelElement,
-    path: str,
+# Handlers by concrete element type; subclasses are resolved and added on first use.
+# File and Blob map to None and are skipped as per requirements.
+_HANDLERS: dict[type, _Handler | None] = {
+    model.Property: _emit_leaf,
+    model.MultiLanguageProperty: _emit_leaf,
+    model.SubmodelElementCollection: _handle_collection,
+    model.SubmodelElementList: _handle_list,
+    model.Range: _emit_range,
+    model.ReferenceElement: _emit_reference,
+    model.Entity: _handle_entity,
+    model.RelationshipElement: _emit_relationship,
+    model.File: None,
+    model.Blob: None,
+}
+
+
+def _resolve_handler(element: model.SubmodelElement) -> _Handler | None:
+    """Find the handler for an element type not yet in ``_HANDLERS``.
+
+    Runs the isinstance checks once per type and memoizes the result.
+
+    Returns:
+        The handler, or None for element types that are skipped.
+    """
+    handler: _Handler | None
+    if isinstance(element, (model.File, model.Blob)):
+        handler = None
+    elif isinstance(element, model.SubmodelElementCollection):
+        handler = _handle_collection
+    elif isinstance(element, model.SubmodelElementList):
+        handler = _handle_list
+    elif isinstance(element, model.Range):
+        handler = _emit_range
+    elif isinstance(element, model.ReferenceElement):
+        handler = _emit_reference
+    elif isinstance(element, model.Entity):
+        handler = _handle_entity
+    elif isinstance(element, model.RelationshipElement):
+        handler = _emit_relationship
+    else:
+        handler = _emit_leaf
+    _HANDLERS[type(element)] = handler
+    return handler
+
+
+def _start_state(
+    submodel: model.Submodel,
     aas_source: str,
-    timestamp_ms: int,
     preferred_lang: str,
-    submodel_semantic_id: str | None = None,
-) -> Iterator[ContextMetric]:
-    """Create a metric from a leaf element."""
-    aas_type = type(element).__name__
-    value = _get_value(element, preferred_lang)
-    value_type = _get_value_type(element)
-    semantic_keys = _extract_semantic_references(element)
-    semantic_id = semantic_keys[0] if semantic_keys else None
-    unit = _extract_unit(element)
+    timestamp_ms: int | None,
+) -> _FlattenState:
+    """Create the traversal state of a submodel with its top-level elements queued.
 
-    yield ContextMetric(
-        path=path,
-        value=value,
-        aas_type=aas_type,
-        value_type=value_type,
-        semantic_id=semantic_id,
-        unit=unit,
-        aas_source=aas_source,
-        timestamp_ms=timestamp_ms,
-        semantic_keys=semantic_keys,
-        submodel_semantic_id=submodel_semantic_id,
-    )
+    Args:
+        submodel: The AAS submodel to flatten.
+        aas_source: Source identifier (file path or URL).
+        preferred_lang: Preferred language for MultiLanguageProperty.
+        timestamp_ms: Extraction timestamp. Defaults to now.
+
+    Returns:
+        State whose stack yields the elements in document order.
+    """
+    if timestamp_ms is None:
+        timestamp_ms = int(time.time() * 1000)
+    # Extract submodel's semantic ID for context propagation
+    state = _FlattenState(aas_source, timestamp_ms, preferred_lang, _extract_semantic_id(submodel))
+    submodel_path = submodel.id_short or "unnamed"
+    state.stack.extend((element, submodel_path) for element in submodel.submodel_element or [])
+    state.stack.reverse()
+    return state
+
+
+def _flatten_elements(state: _FlattenState, pause: bool = False) -> None:
+    """Flatten queued submodel elements into ``state.metrics``, depth first.
+
+    Uses an explicit work stack instead of recursive generators. Children
+    are pushed in reverse so metrics come out in document order.
+
+    Args:
+        state: Traversal state holding the work stack and collected metrics.
+        pause: Return as soon as an element has produced metrics, leaving the
+            rest of the stack for the next call.
+    """
+    stack = state.stack
+    metrics = state.metrics
+    while stack:
+        element, path = stack.pop()
+        try:
+            handler = _HANDLERS[type(element)]
+        except KeyError:
+            handler = _resolve_handler(element)
+        if handler is None:
+            _log_skipped(element, path)
+            continue
+        id_short = element.id_short or "unnamed"
+        handler(element, f"{path}.{id_short}" if path else id_short, state)
+        if pause and metrics:
+            return
 
 
 def flatten_submodel(
     submodel: model.Submodel,
     aas_source: str = "",
     preferred_lang: str = "en",
+    timestamp_ms: int | None = None,
 ) -> list[ContextMetric]:
     """Flatten a submodel into a list of metrics.
 
-    Recursively traverses the submodel structure and produces a ContextMetric
+    Traverses the submodel structure depth first and produces a ContextMetric
     for each leaf element (Property, MultiLanguageProperty) and Range bounds.
 
     Args:
         submodel: The AAS submodel to flatten.
         aas_source: Source identifier for provenance.
         preferred_lang: Preferred language code for MultiLanguageProperty.
+        timestamp_ms: Extraction timestamp for all metrics. Defaults to now;
+            pass one snapshot time to stamp several submodels alike.
 
     Returns:
         List of ContextMetric objects representing all leaf values.
     """
     start_time = time.perf_counter()
-    timestamp_ms = int(time.time() * 1000)
-    metrics: list[ContextMetric] = []
-    submodel_path = submodel.id_short or "unnamed"
-
-    # Extract submodel's semantic ID for context propagation
-    submodel_semantic_id = _extract_semantic_id(submodel)
-
-    for element in submodel.submodel_element or []:
-        for metric in _flatten_element(
-            element,
-            submodel_path,
-            aas_source,
-            timestamp_ms,
-            preferred_lang,
-            submodel_semantic_id,
-        ):
-            metrics.append(metric)
+    state = _start_state(submodel, aas_source, preferred_lang, timestamp_ms)
+    _flatten_elements(state)
+    metrics = state.metrics
 
     duration = time.perf_counter() - start_time
-    METRICS.traversal_duration_seconds.observe(duration)
+    _observe_traversal(duration)
     logger.debug("Flattened submodel %s: %d metrics", submodel.id_short, len(metrics))
     return metrics
 
 
+def iter_submodel_metrics(
+    submodel: model.Submodel,
+    aas_source: str = "",
+    preferred_lang: str = "en",
+    timestamp_ms: int | None = None,
+) -> Iterator[ContextMetric]:
+    """Lazily flatten a submodel, yielding metrics as they are produced.
+
+    Streaming variant of :func:`flatten_submodel` for consumers that handle
+    metrics one at a time, so the full list is never held in memory. The
+    traversal duration is recorded once the submodel is exhausted and
+    excludes the time the consumer spends between metrics.
+
+    Args:
+        submodel: The AAS submodel to flatten.
+        aas_source: Source identifier for provenance.
+        preferred_lang: Preferred language code for MultiLanguageProperty.
+        timestamp_ms: Extraction timestamp for all metrics. Defaults to now.
+
+    Yields:
+        ContextMetric objects in the same order as :func:`flatten_submodel`.
+    """
+    elapsed = 0.0
+    started = time.perf_counter()
+    state = _start_state(submodel, aas_source, preferred_lang, timestamp_ms)
+    metrics = state.metrics
+    while state.stack:
+        # Hand over whatever the next element produced before descending further
+        _flatten_elements(state, pause=True)
+        elapsed += time.perf_counter() - started
+        yield from metrics
+        metrics.clear()
+        started = time.perf_counter()
+
+    _observe_traversal(elapsed + time.perf_counter() - started)
+
+
 def get_global_asset_id(aas: model.AssetAdministrationShell) -> str | None:
     """Extract the globalAssetId from an AAS."""
     if aas.asset_information and aas.asset_information.global_asset_id:
@@ -431,20 +559,24 @@ def iter_submodels(
     Yields:
         Tuples of (submodel, global_asset_id) for each submodel.
     """
+    # Partition the store in a single pass
+    shells: list[model.AssetAdministrationShell] = []
+    submodels: list[model.Submodel] = []
+    for obj in object_store:
+        if isinstance(obj, model.Submodel):
+            submodels.append(obj)
+        elif isinstance(obj, model.AssetAdministrationShell):
+            shells.append(obj)
+
     # Build mapping of submodel references to asset IDs
     submodel_to_asset: dict[str, str] = {}
-
-    for obj in object_store:
-        if isinstance(obj, model.AssetAdministrationShell):
-            asset_id = get_global_asset_id(obj)
-            if asset_id and obj.submodel:
-                for ref in obj.submodel:
-                    keys = list(ref.key)
-                    if keys:
-                        submodel_to_asset[keys[0].value] = asset_id
+    for aas in shells:
+        asset_id = get_global_asset_id(aas)
+        if asset_id and aas.submodel:
+            for ref in aas.submodel:
+                if ref.key:
+                    submodel_to_asset[ref.key[0].value] = asset_id
 
     # Yield submodels with their asset IDs
-    for obj in object_store:
-        if isinstance(obj, model.Submodel):
-            asset_id = submodel_to_asset.get(obj.id)
-            yield obj, asset_id
+    for submodel in submodels:
+        yield submodel, submodel_to_asset.get(submodel.id)
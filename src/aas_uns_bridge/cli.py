@@ -1,12 +1,15 @@
 """Command-line interface for the AAS-UNS Bridge."""
 
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from aas_uns_bridge import __version__
-from aas_uns_bridge.config import BridgeSettings, load_config
+
+if TYPE_CHECKING:
+    # Imported inside commands: pydantic-settings dominates CLI startup time
+    from aas_uns_bridge.config import BridgeSettings
 
 app = typer.Typer(
     name="aas-uns-bridge",
@@ -15,6 +18,18 @@ app = typer.Typer(
 )
 
 
+def _build_settings(config: Path | None, mappings: Path | None) -> "BridgeSettings":
+    """Build settings once, letting CLI options override the environment."""
+    from aas_uns_bridge.config import BridgeSettings
+
+    overrides: dict[str, Path] = {}
+    if config:
+        overrides["config_file"] = config
+    if mappings:
+        overrides["mappings_file"] = mappings
+    return BridgeSettings(**overrides)
+
+
 @app.callback()
 def callback() -> None:
     """AAS-UNS Bridge CLI."""
@@ -33,13 +48,10 @@ def run(
     ] = None,
 ) -> None:
     """Run the AAS-UNS Bridge daemon."""
+    from aas_uns_bridge.config import load_config
     from aas_uns_bridge.daemon import run_daemon
 
-    settings = BridgeSettings()
-    if config:
-        settings = BridgeSettings(config_file=config, mappings_file=settings.mappings_file)
-    if mappings:
-        settings = BridgeSettings(config_file=settings.config_file, mappings_file=mappings)
+    settings = _build_settings(config, mappings)
 
     cfg = load_config(settings)
     run_daemon(cfg, settings.mappings_file)
@@ -57,11 +69,9 @@ def validate(
     ] = None,
 ) -> None:
     """Validate configuration files without starting the daemon."""
-    settings = BridgeSettings()
-    if config:
-        settings = BridgeSettings(config_file=config, mappings_file=settings.mappings_file)
-    if mappings:
-        settings = BridgeSettings(config_file=settings.config_file, mappings_file=mappings)
+    from aas_uns_bridge.config import load_config
+
+    settings = _build_settings(config, mappings)
 
     try:
         cfg = load_config(settings)
@@ -87,6 +97,8 @@ def status() -> None:
     """Check the status of a running bridge instance."""
     import httpx
 
+    from aas_uns_bridge.config import BridgeSettings, load_config
+
     settings = BridgeSettings()
     cfg = load_config(settings)
 
@@ -1,12 +1,16 @@
 """Configuration models for the AAS-UNS Bridge."""
 
+import functools
 from pathlib import Path
-from typing import Literal, Self
+from typing import Any, Literal, Self
 
 import yaml
 from pydantic import BaseModel, Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ValueConstraint(BaseModel):
     """Constraint definition for a specific semantic ID."""
@@ -70,7 +74,7 @@ class LifecycleConfig(BaseModel):
     enabled: bool = False
     """Enable lifecycle tracking."""
 
-    stale_threshold_seconds: int = 300
+    stale_threshold_seconds: int = Field(default=300, gt=0)
     """Time after which an asset is considered stale."""
 
     clear_retained_on_offline: bool = False
@@ -118,15 +122,10 @@ class SemanticConfig(BaseModel):
         - Level 1+: Enable validation
         - Level 2: Enable User Properties
         """
-        if self.sqos_level >= 1:
-            # Enable validation at level 1+
-            self.validation = ValidationConfig(
-                enabled=True,
-                enforce_semantic_ids=self.validation.enforce_semantic_ids,
-                required_for_types=self.validation.required_for_types,
-                reject_invalid=self.validation.reject_invalid,
-                value_constraints=self.validation.value_constraints,
-            )
+        if self.sqos_level >= 1 and not self.validation.enabled:
+            # Enable validation at level 1+; the fields are already validated,
+            # and copying leaves a caller-supplied ValidationConfig untouched
+            self.validation = self.validation.model_copy(update={"enabled": True})
         if self.sqos_level >= 2:
             # Enable User Properties at level 2
             self.use_user_properties = True
@@ -184,9 +183,15 @@ class RepoClientConfig(BaseModel):
 
     enabled: bool = False
     base_url: str = "http://localhost:8080"
-    poll_interval_seconds: float = 60.0
+    poll_interval_seconds: float = Field(default=60.0, gt=0.0)
     timeout_seconds: float = 30.0
     auth_token: SecretStr | None = None
+    max_concurrent_requests: int = Field(default=16, ge=1)
+    """Maximum in-flight GET requests while fetching shells and submodels."""
+    http2: bool = False
+    """Multiplex requests over HTTP/2 (requires the ``http2`` extra)."""
+    descriptor_cache_ttl_seconds: float = Field(default=0.0, ge=0.0)
+    """Reuse shell/submodel listings for this long; 0 lists on every poll."""
 
 
 class StateConfig(BaseModel):
@@ -300,6 +305,9 @@ class BidirectionalConfig(BaseModel):
     auth_token: SecretStr | None = None
     """Bearer token for repository authentication."""
 
+    http2: bool = False
+    """Multiplex write requests over HTTP/2 (requires the ``http2`` extra)."""
+
     command_topic_suffix: str = "/cmd"
     """Suffix identifying command topics."""
 
@@ -366,10 +374,26 @@ class BridgeConfig(BaseModel):
 
     @classmethod
     def from_yaml(cls, path: Path) -> "BridgeConfig":
-        """Load configuration from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls.model_validate(data or {})
+        """Load configuration from a YAML file.
+
+        Parsed documents are cached by path, modification time and size, so
+        repeated loads of an unchanged file skip YAML parsing and only
+        revalidate, which also gives each caller its own instance.
+        """
+        stat = path.stat()
+        data = _read_yaml_cached(str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+        return cls.model_validate(data)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_yaml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML config file; the stat fields only key the cache.
+
+    Callers must not mutate the returned mapping.
+    """
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data or {}
 
 
 class BridgeSettings(BaseSettings):
@@ -389,6 +413,7 @@ def load_config(settings: BridgeSettings | None = None) -> BridgeConfig:
     if settings is None:
         settings = BridgeSettings()
 
-    if settings.config_file.exists():
+    try:
         return BridgeConfig.from_yaml(settings.config_file)
-    return BridgeConfig()
+    except FileNotFoundError:
+        return BridgeConfig()
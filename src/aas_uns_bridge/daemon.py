@@ -1,19 +1,25 @@
 """Main daemon orchestration for the AAS-UNS Bridge."""
 
-import hashlib
+import fnmatch
+import heapq
 import json
 import logging
+import math
+import os
+import queue
+import re
 import signal
 import threading
 import time
-from collections import defaultdict
-from collections.abc import Callable
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from aas_uns_bridge.aas.fingerprint import file_fingerprint
 from aas_uns_bridge.aas.loader import load_file
 from aas_uns_bridge.aas.repo_client import AASRepoClient
 from aas_uns_bridge.aas.repository_client import AasRepositoryClient
@@ -45,6 +51,13 @@ from aas_uns_bridge.validation import SemanticValidator
 
 logger = logging.getLogger(__name__)
 
+# Files modified within this long of being hashed are re-hashed even when their
+# size and mtime are unchanged, as coarse filesystem timestamps can hide a rewrite
+_RACY_MTIME_NS = 2_000_000_000
+
+# Longest main-loop sleep when no periodic task is due sooner
+_IDLE_WAIT_SECONDS = 60.0
+
 
 class AASFileHandler(FileSystemEventHandler):
     """File system event handler for AASX files."""
@@ -64,48 +77,109 @@ class AASFileHandler(FileSystemEventHandler):
         """
         self.callback = callback
         self.patterns = [p.lower() for p in patterns]
+        # One alternation of all glob patterns, matched against file names
+        self._pattern_re = re.compile(
+            "|".join(fnmatch.translate(p) for p in self.patterns) or "(?!)", re.IGNORECASE
+        )
         self.debounce = debounce_seconds
-        self._pending: dict[str, float] = {}
+        # Monotonic fire time of each path waiting for its debounce to elapse
+        self._deadlines: dict[str, float] = {}
         self._lock = threading.Lock()
+        self._events: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
 
     def _matches_pattern(self, path: Path) -> bool:
         """Check if a path matches any watched pattern."""
-        name = path.name.lower()
-        for pattern in self.patterns:
-            if pattern.startswith("*"):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif name == pattern:
-                return True
-        return False
+        return self._matches_name(path.name)
+
+    def _matches_name(self, name: str) -> bool:
+        """Check if a file name matches any watched pattern."""
+        return self._pattern_re.match(name) is not None
+
+    def iter_matching_files(self, root: Path, recursive: bool) -> Iterator[Path]:
+        """Yield existing files below a directory that match the watched patterns.
+
+        Directory entries are filtered by name before any ``Path`` is built,
+        and each file is yielded once even if several patterns match it.
+        Symlinked directories are not followed.
+
+        Args:
+            root: Directory to scan.
+            recursive: Whether to descend into subdirectories.
+
+        Yields:
+            Path of each matching file.
+        """
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                if self._matches_name(name):
+                    yield Path(dirpath, name)
+            if not recursive:
+                break
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle file system events."""
         if event.is_directory:
             return
 
-        path = Path(event.src_path)
-        if not self._matches_pattern(path):
+        # Paths stay strings until a callback fires
+        key = os.fsdecode(event.src_path)
+        if not self._matches_name(os.path.basename(key)):
             return
 
-        # Debounce rapid events
+        # Debounce rapid events: a path already waiting is not rescheduled
         with self._lock:
-            now = time.time()
-            last_event = self._pending.get(str(path), 0)
-            if now - last_event < self.debounce:
+            if key in self._deadlines:
                 return
-            self._pending[str(path)] = now
+            self._deadlines[key] = time.monotonic() + self.debounce
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="aasx-file-events", daemon=True
+                )
+                self._worker.start()
+        self._events.put(key)
+
+    def _run(self) -> None:
+        """Fire callbacks one at a time as their debounce delays elapse."""
+        due: list[tuple[float, str]] = []
+        while True:
+            timeout = max(due[0][0] - time.monotonic(), 0.0) if due else None
+            try:
+                key = self._events.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if key is None:
+                    return
+                with self._lock:
+                    heapq.heappush(due, (self._deadlines[key], key))
+
+            while due and due[0][0] <= time.monotonic():
+                _, key = heapq.heappop(due)
+                # Events from here on schedule a fresh run for this path
+                with self._lock:
+                    del self._deadlines[key]
+                self._fire(Path(key))
+
+    def _fire(self, path: Path) -> None:
+        """Invoke the callback for a path that still exists."""
+        if path.exists():
+            try:
+                self.callback(path)
+            except Exception as e:
+                logger.error("Error processing %s: %s", path, e)
 
-        # Delay callback to allow file writes to complete
-        def delayed_callback() -> None:
-            time.sleep(self.debounce)
-            if path.exists():
-                try:
-                    self.callback(path)
-                except Exception as e:
-                    logger.error("Error processing %s: %s", path, e)
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the event worker, dropping callbacks not yet due.
 
-        threading.Thread(target=delayed_callback, daemon=True).start()
+        Args:
+            timeout: Seconds to wait for a running callback to finish.
+        """
+        with self._lock:
+            worker = self._worker
+        if worker is not None:
+            self._events.put(None)
+            worker.join(timeout)
 
 
 class BridgeDaemon:
@@ -124,7 +198,8 @@ class BridgeDaemon:
         """
         self.config = config
         self._shutdown = threading.Event()
-        self._file_hashes: dict[str, str] = {}
+        # Path -> (mtime_ns, size, hashed_at_ns, fingerprint) of the last processed content
+        self._file_hashes: dict[str, tuple[int, int, int, str]] = {}
 
         # Initialize components
         self._init_logging()
@@ -224,6 +299,7 @@ class BridgeDaemon:
                     if config.hypervisor.bidirectional.auth_token
                     else None
                 ),
+                http2=config.hypervisor.bidirectional.http2,
             )
             # Note: BidirectionalSync initialization deferred until MQTT client exists
 
@@ -308,6 +384,7 @@ class BridgeDaemon:
 
         # File watcher
         self._observer: Any | None = None
+        self._file_handler: AASFileHandler | None = None
         if config.file_watcher.enabled:
             self._setup_file_watcher()
 
@@ -332,7 +409,7 @@ class BridgeDaemon:
         watch_dir = self.config.file_watcher.watch_dir
         watch_dir.mkdir(parents=True, exist_ok=True)
 
-        handler = AASFileHandler(
+        self._file_handler = AASFileHandler(
             callback=self._process_aas_file,
             patterns=self.config.file_watcher.patterns,
             debounce_seconds=self.config.file_watcher.debounce_seconds,
@@ -340,7 +417,7 @@ class BridgeDaemon:
 
         self._observer = Observer()
         self._observer.schedule(  # type: ignore[no-untyped-call]
-            handler,
+            self._file_handler,
             str(watch_dir),
             recursive=self.config.file_watcher.recursive,
         )
@@ -433,19 +510,32 @@ class BridgeDaemon:
                 logger.error("Failed to clear retained message on %s: %s", topic, e)
 
     def _compute_file_hash(self, path: Path) -> str:
-        """Compute SHA256 hash of a file."""
-        hasher = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        """Compute the change-detection fingerprint of a file."""
+        return file_fingerprint(path)
 
     def _file_has_changed(self, path: Path) -> bool:
-        """Check if a file has changed since last processing."""
+        """Check if a file has changed since last processing.
+
+        Files whose size and modification time are unchanged are not read
+        again, unless they were modified too close to the last hash for the
+        timestamp to be trusted.
+        """
+        key = str(path)
+        stat = path.stat()
+        previous = self._file_hashes.get(key)
+        if previous is not None:
+            mtime_ns, size, hashed_at_ns, _ = previous
+            if (
+                stat.st_mtime_ns == mtime_ns
+                and stat.st_size == size
+                and mtime_ns < hashed_at_ns - _RACY_MTIME_NS
+            ):
+                return False
+
+        hashed_at_ns = time.time_ns()
         current_hash = self._compute_file_hash(path)
-        previous_hash = self._file_hashes.get(str(path))
-        self._file_hashes[str(path)] = current_hash
-        return current_hash != previous_hash
+        self._file_hashes[key] = (stat.st_mtime_ns, stat.st_size, hashed_at_ns, current_hash)
+        return previous is None or current_hash != previous[3]
 
     def _process_aas_file(self, path: Path) -> None:
         """Process an AAS file (AASX or JSON).
@@ -475,96 +565,109 @@ class BridgeDaemon:
         - Drift detection: Detects structural changes in metric schemas
         - Lifecycle tracking: Tracks asset online/offline states
 
+        If a submodel fails, the UNS changes of the submodels processed before
+        it are still published and the error is re-raised. Such a partial
+        failure publishes UNS only: Sparkplug, lifecycle and fidelity updates
+        are skipped for the whole object store.
+
         Args:
             object_store: BaSyx ObjectStore with AAS content.
             source: Source identifier (file path or URL).
         """
         device_metrics_all: dict[str, list[ContextMetric]] = defaultdict(list)
         device_metrics_changed: dict[str, list[ContextMetric]] = defaultdict(list)
+        # Changed UNS metrics of all submodels, published and recorded at once
+        changed_all: dict[str, ContextMetric] = {}
         processed_assets: set[str] = set()  # Track for lifecycle updates
+        # All metrics from one object store share the snapshot time
+        snapshot_ms = int(time.time() * 1000)
 
-        for submodel, global_asset_id in iter_submodels(object_store):
-            if not submodel.id_short:
-                continue
-
-            # Flatten submodel to metrics
-            metrics = flatten_submodel(
-                submodel,
-                aas_source=source,
-                preferred_lang=self.config.preferred_language,
-            )
-
-            if not metrics:
-                continue
-
-            METRICS.metrics_flattened_total.inc(len(metrics))
-            logger.debug(
-                "Flattened %s: %d metrics",
-                submodel.id_short,
-                len(metrics),
-            )
-
-            # Schema drift detection runs on RAW metrics (before validation filtering)
-            # to avoid false "removal" events when reject_invalid filters out metrics
-            if self.drift_detector and global_asset_id:
-                self._check_and_handle_drift(global_asset_id, metrics)
-
-            # Streaming (incremental) drift detection for numeric values
-            if self.streaming_drift and global_asset_id:
-                self._check_streaming_drift(global_asset_id, metrics)
-
-            # Semantic validation (sQoS level 1+)
-            if self.validator:
-                result = self.validator.validate_batch(metrics)
-                self._record_validation_metrics(result)
-
-                if result.invalid_count > 0:
-                    logger.warning(
-                        "Validation found %d errors in %s",
-                        result.total_errors,
-                        submodel.id_short,
-                    )
-
-                # Filter to valid metrics only if reject_invalid is enabled
-                if self.config.semantic.validation.reject_invalid:
-                    metrics = result.valid_metrics
-                    if not metrics:
-                        continue
-
-            # Build topics for UNS
-            topic_metrics = self.mapper.build_topics_for_submodel(
-                metrics,
-                global_asset_id,
-                submodel.id_short,
-            )
+        try:
+            for submodel, global_asset_id in iter_submodels(object_store):
+                if not submodel.id_short:
+                    continue
+
+                # Flatten submodel to metrics
+                metrics = flatten_submodel(
+                    submodel,
+                    aas_source=source,
+                    preferred_lang=self.config.preferred_language,
+                    timestamp_ms=snapshot_ms,
+                )
 
-            changed_topic_metrics = topic_metrics
-            if self.config.state.deduplicate_publishes:
-                changed_topic_metrics = self.last_published.filter_changed(topic_metrics)
+                if not metrics:
+                    continue
 
-            # Publish to UNS retained topics (changed only)
-            if self.config.uns.enabled and changed_topic_metrics:
-                self.uns_publisher.publish_batch(changed_topic_metrics, source)
+                METRICS.metrics_flattened_total.inc(len(metrics))
+                logger.debug(
+                    "Flattened %s: %d metrics",
+                    submodel.id_short,
+                    len(metrics),
+                )
 
-            # Track asset for lifecycle
-            if global_asset_id:
-                processed_assets.add(global_asset_id)
+                # Schema drift detection runs on RAW metrics (before validation filtering)
+                # to avoid false "removal" events when reject_invalid filters out metrics
+                if self.drift_detector and global_asset_id:
+                    self._check_and_handle_drift(global_asset_id, metrics)
+
+                # Streaming (incremental) drift detection for numeric values
+                if self.streaming_drift and global_asset_id:
+                    self._check_streaming_drift(global_asset_id, metrics)
+
+                # Semantic validation (sQoS level 1+)
+                if self.validator:
+                    result = self.validator.validate_batch(metrics)
+                    self._record_validation_metrics(result)
+
+                    if result.invalid_count > 0:
+                        logger.warning(
+                            "Validation found %d errors in %s",
+                            result.total_errors,
+                            submodel.id_short,
+                        )
 
-            # Accumulate Sparkplug metrics
-            if self.config.sparkplug.enabled and global_asset_id:
-                identity = self.mapper.get_identity(global_asset_id)
-                device_id = identity.asset or submodel.id_short
+                    # Filter to valid metrics only if reject_invalid is enabled
+                    if self.config.semantic.validation.reject_invalid:
+                        metrics = result.valid_metrics
+                        if not metrics:
+                            continue
+
+                # Build topics for UNS
+                topic_metrics = self.mapper.build_topics_for_submodel(
+                    metrics,
+                    global_asset_id,
+                    submodel.id_short,
+                )
 
-                device_metrics_all[device_id].extend(metrics)
+                changed_topic_metrics = topic_metrics
                 if self.config.state.deduplicate_publishes:
-                    device_metrics_changed[device_id].extend(list(changed_topic_metrics.values()))
-                else:
-                    device_metrics_changed[device_id].extend(metrics)
+                    changed_topic_metrics = self.last_published.filter_changed(topic_metrics)
+
+                changed_all.update(changed_topic_metrics)
+
+                # Track asset for lifecycle
+                if global_asset_id:
+                    processed_assets.add(global_asset_id)
+
+                # Accumulate Sparkplug metrics
+                if self.config.sparkplug.enabled and global_asset_id:
+                    identity = self.mapper.get_identity(global_asset_id)
+                    device_id = identity.asset or submodel.id_short
+
+                    device_metrics_all[device_id].extend(metrics)
+                    if self.config.state.deduplicate_publishes:
+                        device_metrics_changed[device_id].extend(changed_topic_metrics.values())
+                    else:
+                        device_metrics_changed[device_id].extend(metrics)
+        except BaseException:
+            # Publish what was collected, without masking the original error
+            try:
+                self._publish_uns_changes(changed_all, source)
+            except Exception:
+                logger.exception("Failed to publish UNS changes collected before the error")
+            raise
 
-            # Update hash cache for UNS deduplication
-            if self.config.state.deduplicate_publishes and changed_topic_metrics:
-                self.last_published.update_batch(changed_topic_metrics)
-                METRICS.tracked_topics.set(self.last_published.count)
+        self._publish_uns_changes(changed_all, source)
 
         # Update lifecycle tracking for processed assets
         if self.lifecycle_tracker:
@@ -585,6 +688,25 @@ class BridgeDaemon:
                     aas_uri=source,
                 )
 
+    def _publish_uns_changes(self, changed: dict[str, ContextMetric], source: str) -> None:
+        """Publish changed UNS metrics and record them for deduplication.
+
+        Args:
+            changed: Changed metrics keyed by UNS topic.
+            source: Source identifier (file path or URL).
+        """
+        if not changed:
+            return
+
+        # Publish to UNS retained topics (changed only)
+        if self.config.uns.enabled:
+            self.uns_publisher.publish_batch(changed, source)
+
+        # Update hash cache for UNS deduplication
+        if self.config.state.deduplicate_publishes:
+            self.last_published.update_batch(changed)
+            METRICS.tracked_topics.set(self.last_published.count)
+
     def _poll_repository(self) -> None:
         """Poll the AAS Repository for changes."""
         if not self._repo_client:
@@ -606,13 +728,21 @@ class BridgeDaemon:
         Args:
             result: BatchValidationResult from semantic validator.
         """
+        # Count locally so each label child is incremented once per batch
+        invalid = 0
+        error_counts: Counter[str] = Counter()
         for vr in result.results:
-            if vr.is_valid:
-                METRICS.validation_metrics_total.labels(result="valid").inc()
-            else:
-                METRICS.validation_metrics_total.labels(result="invalid").inc()
-                for error in vr.errors:
-                    METRICS.validation_errors_total.labels(error_type=error.error_type.value).inc()
+            if vr.errors:
+                invalid += 1
+                error_counts.update(error.error_type.value for error in vr.errors)
+
+        valid = len(result.results) - invalid
+        if valid:
+            METRICS.validation_metrics_total.labels(result="valid").inc(valid)
+        if invalid:
+            METRICS.validation_metrics_total.labels(result="invalid").inc(invalid)
+        for error_type, count in error_counts.items():
+            METRICS.validation_errors_total.labels(error_type=error_type).inc(count)
 
     def _check_and_handle_drift(self, asset_id: str, metrics: list[ContextMetric]) -> None:
         """Check for schema drift and publish alerts if detected.
@@ -838,16 +968,16 @@ class BridgeDaemon:
             return
 
         watch_dir = self.config.file_watcher.watch_dir
-        if not watch_dir.exists():
+        if not watch_dir.exists() or self._file_handler is None:
             return
 
-        for pattern in self.config.file_watcher.patterns:
-            glob_pattern = f"**/{pattern}" if self.config.file_watcher.recursive else pattern
-            for path in watch_dir.glob(glob_pattern):
-                try:
-                    self._process_aas_file(path)
-                except Exception as e:
-                    logger.error("Error processing %s: %s", path, e)
+        for path in self._file_handler.iter_matching_files(
+            watch_dir, self.config.file_watcher.recursive
+        ):
+            try:
+                self._process_aas_file(path)
+            except Exception as e:
+                logger.error("Error processing %s: %s", path, e)
 
     def start(self) -> None:
         """Start the bridge daemon."""
@@ -884,38 +1014,46 @@ class BridgeDaemon:
         """Run the main daemon loop."""
         self.start()
 
-        poll_interval = (
-            self.config.repo_client.poll_interval_seconds
-            if self.config.repo_client.enabled
-            else 60.0
-        )
+        poll_interval = self.config.repo_client.poll_interval_seconds
+        stale_check_interval = self.config.semantic.lifecycle.stale_threshold_seconds / 2
 
-        # Use shorter interval if lifecycle tracking needs frequent checks
-        if self.lifecycle_tracker:
-            stale_check_interval = min(
-                poll_interval,
-                self.config.semantic.lifecycle.stale_threshold_seconds / 2,
-            )
-        else:
-            stale_check_interval = poll_interval
+        # Repository polls and stale-asset checks run on independent deadlines;
+        # start() has already polled the repository once
+        now = time.monotonic()
+        next_poll = now + poll_interval if self._repo_client else math.inf
+        next_stale_check = now if self.lifecycle_tracker else math.inf
 
         try:
             while not self._shutdown.is_set():
+                now = time.monotonic()
+
                 # Poll repository periodically
-                if self._repo_client:
+                if now >= next_poll:
                     self._poll_repository()
+                    next_poll = now + poll_interval
 
                 # Check for stale assets
-                self._check_stale_assets()
+                if now >= next_stale_check:
+                    self._check_stale_assets()
+                    next_stale_check = now + stale_check_interval
 
-                # Wait for shutdown or next poll
-                self._shutdown.wait(stale_check_interval)
+                # Wait for shutdown or the next due task
+                next_due = min(next_poll, next_stale_check, now + _IDLE_WAIT_SECONDS)
+                self._shutdown.wait(max(next_due - time.monotonic(), 0.0))
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
 
         self.shutdown()
 
+    def request_shutdown(self) -> None:
+        """Ask the main loop to stop; ``run()`` then calls ``shutdown()``.
+
+        Safe to call from a signal handler, which may interrupt a repository
+        poll inside its event loop where the clients cannot be closed.
+        """
+        self._shutdown.set()
+
     def shutdown(self) -> None:
         """Gracefully shut down the daemon."""
         logger.info("Shutting down AAS-UNS Bridge daemon")
@@ -925,6 +1063,8 @@ class BridgeDaemon:
         if self._observer:
             self._observer.stop()
             self._observer.join(timeout=5)
+        if self._file_handler:
+            self._file_handler.stop(timeout=5)
 
         # Shutdown Sparkplug (sends DDEATHs)
         if self.config.sparkplug.enabled:
@@ -958,7 +1098,7 @@ def run_daemon(config: BridgeConfig, mappings_path: Path) -> None:
     # Set up signal handlers
     def signal_handler(signum: int, frame: Any) -> None:
         logger.info("Received signal %d", signum)
-        daemon.shutdown()
+        daemon.request_shutdown()
 
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
@@ -165,6 +165,19 @@ class ISA95Mapper:
         Returns:
             Full sanitized MQTT topic path.
         """
+        prefix = self._topic_prefix(global_asset_id, submodel_id_short)
+        return f"{prefix}/{self._element_topic(metric.path, submodel_id_short)}"
+
+    def _topic_prefix(self, global_asset_id: str | None, submodel_id_short: str) -> str:
+        """Build the topic levels shared by every metric of a submodel.
+
+        Args:
+            global_asset_id: The asset's globalAssetId.
+            submodel_id_short: The submodel's idShort.
+
+        Returns:
+            Topic path up to and including the sanitized submodel name.
+        """
         parts: list[str] = []
 
         # Add root topic if configured
@@ -193,17 +206,18 @@ class ISA95Mapper:
         # Add submodel name
         parts.append(sanitize_segment(submodel_id_short))
 
-        # Add element path (convert dot-separated to slash-separated)
-        # Skip the submodel prefix if it's already in the path
-        element_path = metric.path
-        if element_path.startswith(f"{submodel_id_short}."):
-            element_path = element_path[len(submodel_id_short) + 1 :]
-
-        sanitized_path = sanitize_metric_path(element_path)
-        parts.append(sanitized_path)
-
         return "/".join(parts)
 
+    @staticmethod
+    def _element_topic(element_path: str, submodel_id_short: str) -> str:
+        """Convert a metric path to its sanitized topic suffix."""
+        # Convert dot-separated to slash-separated, skipping the submodel
+        # prefix if it's already in the path
+        submodel_prefix = f"{submodel_id_short}."
+        if element_path.startswith(submodel_prefix):
+            element_path = element_path[len(submodel_prefix) :]
+        return sanitize_metric_path(element_path)
+
     def build_topics_for_submodel(
         self,
         metrics: list[ContextMetric],
@@ -220,4 +234,6 @@ class ISA95Mapper:
         Returns:
             Dict mapping topic paths to their metrics.
         """
-        return {self.build_topic(m, global_asset_id, submodel_id_short): m for m in metrics}
+        prefix = self._topic_prefix(global_asset_id, submodel_id_short)
+        element_topic = self._element_topic
+        return {f"{prefix}/{element_topic(m.path, submodel_id_short)}": m for m in metrics}
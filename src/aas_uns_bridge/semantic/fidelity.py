@@ -14,13 +14,14 @@ from __future__ import annotations
 
 import logging
 import math
-import sqlite3
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from aas_uns_bridge.state.db import connect, enable_wal
+
 if TYPE_CHECKING:
     from aas_uns_bridge.domain.models import ContextMetric
 
@@ -147,7 +148,8 @@ class FidelityCalculator:
         if not self.db_path:
             return
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS fidelity_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -443,7 +445,7 @@ class FidelityCalculator:
         if not self.db_path:
             return
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute(
                 """
                 INSERT INTO fidelity_history
@@ -481,7 +483,7 @@ class FidelityCalculator:
         if not self.db_path:
             return []
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT timestamp_ms, overall_score, structural_fidelity,
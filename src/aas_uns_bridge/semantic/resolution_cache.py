@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import json
 import logging
-import sqlite3
 import threading
 import time
 from collections import OrderedDict
@@ -22,6 +21,7 @@ from typing import TYPE_CHECKING
 
 from aas_uns_bridge.observability.metrics import METRICS
 from aas_uns_bridge.semantic.models import SemanticContext, SemanticPointer
+from aas_uns_bridge.state.db import connect, enable_wal
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -75,7 +75,8 @@ class SemanticResolutionCache:
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS semantic_context (
                     hash TEXT PRIMARY KEY,
@@ -99,7 +100,7 @@ class SemanticResolutionCache:
     def _preload_from_db(self) -> None:
         """Preload entries from database into memory cache."""
         loaded = 0
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT hash, semantic_id, dictionary, version, definition,
@@ -215,7 +216,7 @@ class SemanticResolutionCache:
         Returns:
             The SemanticContext if found, None otherwise.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT semantic_id, dictionary, version, definition,
@@ -269,7 +270,7 @@ class SemanticResolutionCache:
         Returns:
             The SemanticContext if found, None otherwise.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT hash, dictionary, version, definition,
@@ -399,7 +400,7 @@ class SemanticResolutionCache:
         hierarchy_json = json.dumps(list(context.hierarchy))
         now = int(time.time())
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO semantic_context
@@ -442,7 +443,7 @@ class SemanticResolutionCache:
             for hash_value, ctx in items
         ]
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.executemany(
                 """
                 INSERT OR REPLACE INTO semantic_context
@@ -470,7 +471,7 @@ class SemanticResolutionCache:
                 return True
 
         # Check database
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT 1 FROM semantic_context WHERE hash = ?", (pointer.hash,))
             return cursor.fetchone() is not None
 
@@ -504,7 +505,7 @@ class SemanticResolutionCache:
     @property
     def total_size(self) -> int:
         """Total number of entries in database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM semantic_context")
             row = cursor.fetchone()
             return row[0] if row else 0
@@ -515,7 +516,7 @@ class SemanticResolutionCache:
             self._memory_cache.clear()
             self._semantic_id_to_hash.clear()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("DELETE FROM semantic_context")
             conn.commit()
 
@@ -9,6 +9,7 @@ from collections.abc import Callable, Iterator
 from pathlib import Path
 
 from aas_uns_bridge.observability.metrics import METRICS
+from aas_uns_bridge.state.db import connect, enable_wal
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +52,8 @@ class AliasDB:
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             # Check if table exists
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='metric_aliases'"
@@ -100,7 +102,7 @@ class AliasDB:
 
     def _load_cache(self) -> None:
         """Load existing aliases into memory cache."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT metric_path, alias FROM metric_aliases")
             for path, alias in cursor:
                 self._cache[path] = alias
@@ -187,12 +189,12 @@ class AliasDB:
         with self._lock:
             if metric_path in self._cache:
                 # Update access time for existing entry
-                with sqlite3.connect(self.db_path) as conn:
+                with connect(self.db_path) as conn:
                     self._update_access_time(conn, metric_path)
                 return self._cache[metric_path]
 
             # Check capacity and evict if needed before inserting
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 self._evict_if_needed(conn)
 
             # Assign new alias
@@ -201,7 +203,7 @@ class AliasDB:
             now = int(time.time())
 
             # Persist to database
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.execute(
                     "INSERT INTO metric_aliases (metric_path, alias, device_id, last_accessed) "
                     "VALUES (?, ?, ?, ?)",
@@ -239,7 +241,7 @@ class AliasDB:
             Dict mapping metric paths to aliases.
         """
         result: dict[str, int] = {}
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT metric_path, alias FROM metric_aliases WHERE device_id = ?",
                 (device_id,),
@@ -267,7 +269,7 @@ class AliasDB:
             Number of aliases removed.
         """
         with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 cursor = conn.execute(
                     "DELETE FROM metric_aliases WHERE device_id = ?",
                     (device_id,),
@@ -285,7 +287,7 @@ class AliasDB:
     def clear_all(self) -> None:
         """Remove all aliases from the database."""
         with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.execute("DELETE FROM metric_aliases")
                 conn.commit()
 
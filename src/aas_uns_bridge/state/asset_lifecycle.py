@@ -2,7 +2,6 @@
 
 import json
 import logging
-import sqlite3
 import threading
 import time
 from dataclasses import dataclass, field
@@ -11,6 +10,7 @@ from pathlib import Path
 
 from aas_uns_bridge.config import LifecycleConfig
 from aas_uns_bridge.mapping.sanitize import sanitize_segment
+from aas_uns_bridge.state.db import connect, enable_wal
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +110,8 @@ class AssetLifecycleTracker:
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS asset_lifecycle (
                     asset_id TEXT PRIMARY KEY,
@@ -124,7 +125,7 @@ class AssetLifecycleTracker:
 
     def _load_state(self) -> None:
         """Load persisted asset states from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT asset_id, state, last_seen_ms, first_seen_ms, topics FROM asset_lifecycle"
             )
@@ -146,7 +147,7 @@ class AssetLifecycleTracker:
         """Persist asset state to database."""
         topics_json = json.dumps(list(asset.topics))
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO asset_lifecycle
@@ -368,7 +369,7 @@ class AssetLifecycleTracker:
 
             del self._assets[asset_id]
 
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.execute(
                     "DELETE FROM asset_lifecycle WHERE asset_id = ?",
                     (asset_id,),
@@ -388,7 +389,7 @@ class AssetLifecycleTracker:
             count = len(self._assets)
             self._assets.clear()
 
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.execute("DELETE FROM asset_lifecycle")
                 conn.commit()
 
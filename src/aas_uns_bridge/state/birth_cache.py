@@ -1,9 +1,10 @@
 """Birth message caching for fast reconnection."""
 
 import logging
-import sqlite3
 from pathlib import Path
 
+from aas_uns_bridge.state.db import connect, enable_wal
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +27,8 @@ class BirthCache:
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS birth_cache (
                     key TEXT PRIMARY KEY,
@@ -62,7 +64,7 @@ class BirthCache:
         """Store a payload in the cache."""
         import time
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO birth_cache (key, payload, topic, timestamp)
@@ -93,7 +95,7 @@ class BirthCache:
 
     def _get(self, key: str) -> tuple[str, bytes] | None:
         """Get a cached payload."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT topic, payload FROM birth_cache WHERE key = ?",
                 (key,),
@@ -109,7 +111,7 @@ class BirthCache:
         Returns:
             List of device identifiers.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT key FROM birth_cache WHERE key LIKE 'dbirth:%'")
             return [row[0].replace("dbirth:", "") for row in cursor]
 
@@ -119,7 +121,7 @@ class BirthCache:
         Args:
             device_id: Device identifier.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute(
                 "DELETE FROM birth_cache WHERE key = ?",
                 (f"dbirth:{device_id}",),
@@ -128,7 +130,7 @@ class BirthCache:
 
     def clear(self) -> None:
         """Clear all cached births."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("DELETE FROM birth_cache")
             conn.commit()
         logger.info("Cleared birth cache")
@@ -3,7 +3,6 @@
 import hashlib
 import json
 import logging
-import sqlite3
 import threading
 import time
 from dataclasses import dataclass, field
@@ -14,6 +13,7 @@ from typing import Any
 from aas_uns_bridge.config import DriftConfig
 from aas_uns_bridge.domain.models import ContextMetric
 from aas_uns_bridge.mapping.sanitize import sanitize_segment
+from aas_uns_bridge.state.db import connect, enable_wal
 
 logger = logging.getLogger(__name__)
 
@@ -176,7 +176,8 @@ class DriftDetector:
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS metric_fingerprints (
                     asset_id TEXT NOT NULL,
@@ -304,7 +305,7 @@ class DriftDetector:
         """
         now = int(time.time())
 
-        with self._lock, sqlite3.connect(self.db_path) as conn:
+        with self._lock, connect(self.db_path) as conn:
             # Delete existing fingerprints for this asset
             conn.execute(
                 "DELETE FROM metric_fingerprints WHERE asset_id = ?",
@@ -348,7 +349,7 @@ class DriftDetector:
         """
         result: dict[str, MetricFingerprint] = {}
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT metric_path, aas_type, value_type, semantic_id, unit
@@ -376,7 +377,7 @@ class DriftDetector:
         Returns:
             List of asset identifiers.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT DISTINCT asset_id FROM metric_fingerprints")
             return [row[0] for row in cursor]
 
@@ -389,7 +390,7 @@ class DriftDetector:
         Returns:
             Number of fingerprints deleted.
         """
-        with self._lock, sqlite3.connect(self.db_path) as conn:
+        with self._lock, connect(self.db_path) as conn:
             cursor = conn.execute(
                 "DELETE FROM metric_fingerprints WHERE asset_id = ?",
                 (asset_id,),
@@ -403,7 +404,7 @@ class DriftDetector:
         Returns:
             Number of fingerprints deleted.
         """
-        with self._lock, sqlite3.connect(self.db_path) as conn:
+        with self._lock, connect(self.db_path) as conn:
             cursor = conn.execute("DELETE FROM metric_fingerprints")
             conn.commit()
             return cursor.rowcount
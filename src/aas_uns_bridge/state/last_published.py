@@ -5,6 +5,7 @@ import json
 import logging
 import os
 import sqlite3
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -12,6 +13,7 @@ from typing import Any
 
 from aas_uns_bridge.domain.models import ContextMetric
 from aas_uns_bridge.observability.metrics import METRICS
+from aas_uns_bridge.state.db import connect, enable_wal
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,9 @@ class LastPublishedHashes:
         self._cache_timestamps: dict[str, int] = {}
         self._persist = db_path is not None
         self._op_count = 0
+        # Serializes cache updates and database writes; reentrant because
+        # cleanup runs from within update paths
+        self._lock = threading.RLock()
 
         if self._persist:
             assert self.db_path is not None
@@ -64,7 +69,8 @@ class LastPublishedHashes:
     def _init_db(self) -> None:
         """Initialize the database schema."""
         assert self.db_path is not None
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             # Check if table exists
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='published_hashes'"
@@ -109,7 +115,7 @@ class LastPublishedHashes:
     def _load_cache(self) -> None:
         """Load hashes from database into memory."""
         assert self.db_path is not None
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT topic, hash, created_at FROM published_hashes")
             for topic, hash_value, created_at in cursor:
                 self._cache[topic] = hash_value
@@ -131,9 +137,14 @@ class LastPublishedHashes:
         serialized = json.dumps(value, sort_keys=True, ensure_ascii=False)
         return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
-    def _maybe_cleanup(self) -> None:
-        """Run cleanup periodically based on operation count."""
-        self._op_count += 1
+    def _maybe_cleanup(self, operations: int = 1) -> None:
+        """Run cleanup periodically based on operation count.
+
+        Args:
+            operations: Number of operations to count; a batch triggers at
+                most one cleanup however large it is.
+        """
+        self._op_count += operations
         if self._op_count >= self.CLEANUP_INTERVAL:
             self._op_count = 0
             self._cleanup_expired()
@@ -161,7 +172,7 @@ class LastPublishedHashes:
         # Remove from database
         if self._persist and expired_topics:
             assert self.db_path is not None
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.execute(
                     "DELETE FROM published_hashes WHERE created_at > 0 AND created_at <= ?",
                     (cutoff,),
@@ -204,7 +215,7 @@ class LastPublishedHashes:
         if self._persist and topics_to_remove:
             assert self.db_path is not None
             placeholders = ",".join("?" * len(topics_to_remove))
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.execute(
                     f"DELETE FROM published_hashes WHERE topic IN ({placeholders})",
                     topics_to_remove,
@@ -228,13 +239,14 @@ class LastPublishedHashes:
         Returns:
             True if the value has changed or never published.
         """
-        self._maybe_cleanup()
+        with self._lock:
+            self._maybe_cleanup()
 
-        # Compute hash of value only (not timestamp)
-        current_hash = self._compute_hash(metric.value)
-        previous_hash = self._cache.get(topic)
+            # Compute hash of value only (not timestamp)
+            current_hash = self._compute_hash(metric.value)
+            previous_hash = self._cache.get(topic)
 
-        return previous_hash != current_hash
+            return previous_hash != current_hash
 
     def update(self, topic: str, metric: ContextMetric) -> None:
         """Update the stored hash for a metric.
@@ -243,42 +255,44 @@ class LastPublishedHashes:
             topic: MQTT topic for the metric.
             metric: The published metric.
         """
-        self._maybe_cleanup()
-
-        now = int(time.time())
-        current_hash = self._compute_hash(metric.value)
+        with self._lock:
+            self._maybe_cleanup()
 
-        # Check if this is a new entry
-        is_new = topic not in self._cache
-
-        self._cache[topic] = current_hash
+            now = int(time.time())
+            current_hash = self._compute_hash(metric.value)
 
-        # Only set created_at for new entries
-        if is_new:
-            self._cache_timestamps[topic] = now
-            # Check max entries when adding new entries
-            self._enforce_max_entries()
+            # Check if this is a new entry
+            is_new = topic not in self._cache
 
-        if self._persist:
-            assert self.db_path is not None
-            with sqlite3.connect(self.db_path) as conn:
-                # Check if entry exists
-                cursor = conn.execute(
-                    "SELECT created_at FROM published_hashes WHERE topic = ?",
-                    (topic,),
-                )
-                row = cursor.fetchone()
-                created_at = row[0] if row else now
+            self._cache[topic] = current_hash
 
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO published_hashes (topic, hash, updated_at, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (topic, current_hash, now, created_at),
-                )
-                conn.commit()
-            self._report_db_size()
+            # Only set created_at for new entries
+            if is_new:
+                self._cache_timestamps[topic] = now
+                # Check max entries when adding new entries
+                self._enforce_max_entries()
+
+            if self._persist:
+                assert self.db_path is not None
+                with connect(self.db_path) as conn:
+                    # Check if entry exists
+                    cursor = conn.execute(
+                        "SELECT created_at FROM published_hashes WHERE topic = ?",
+                        (topic,),
+                    )
+                    row = cursor.fetchone()
+                    created_at = row[0] if row else now
+
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO published_hashes
+                            (topic, hash, updated_at, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (topic, current_hash, now, created_at),
+                    )
+                    conn.commit()
+                self._report_db_size()
 
     def filter_changed(
         self,
@@ -292,11 +306,14 @@ class LastPublishedHashes:
         Returns:
             Filtered dict with only changed metrics.
         """
-        return {
-            topic: metric
-            for topic, metric in topic_metrics.items()
-            if self.has_changed(topic, metric)
-        }
+        with self._lock:
+            self._maybe_cleanup(len(topic_metrics))
+            cache = self._cache
+            return {
+                topic: metric
+                for topic, metric in topic_metrics.items()
+                if cache.get(topic) != self._compute_hash(metric.value)
+            }
 
     def update_batch(self, topic_metrics: dict[str, ContextMetric]) -> None:
         """Update hashes for multiple metrics.
@@ -304,67 +321,55 @@ class LastPublishedHashes:
         Args:
             topic_metrics: Mapping of topics to published metrics.
         """
-        self._maybe_cleanup()
-
-        now = int(time.time())
-        new_entries_added = False
-
-        for topic, metric in topic_metrics.items():
-            current_hash = self._compute_hash(metric.value)
-            is_new = topic not in self._cache
-            self._cache[topic] = current_hash
-            # Only set created_at for new entries
-            if is_new:
-                self._cache_timestamps[topic] = now
-                new_entries_added = True
-
-        if self._persist and topic_metrics:
-            assert self.db_path is not None
-            with sqlite3.connect(self.db_path) as conn:
-                # Get existing created_at values
-                topics = list(topic_metrics.keys())
-                placeholders = ",".join("?" * len(topics))
-                query = (
-                    "SELECT topic, created_at FROM published_hashes "
-                    f"WHERE topic IN ({placeholders})"
-                )
-                cursor = conn.execute(query, topics)
-                existing_created = {row[0]: row[1] for row in cursor}
-
-                conn.executemany(
-                    """
-                    INSERT OR REPLACE INTO published_hashes (topic, hash, updated_at, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            topic,
-                            self._compute_hash(metric.value),
-                            now,
-                            existing_created.get(topic, now),
-                        )
-                        for topic, metric in topic_metrics.items()
-                    ],
-                )
-                conn.commit()
-            self._report_db_size()
+        with self._lock:
+            self._maybe_cleanup()
+
+            now = int(time.time())
+            new_entries_added = False
+
+            rows: list[tuple[str, str, int, int]] = []
+            for topic, metric in topic_metrics.items():
+                current_hash = self._compute_hash(metric.value)
+                is_new = topic not in self._cache
+                self._cache[topic] = current_hash
+                # Only set created_at for new entries
+                if is_new:
+                    self._cache_timestamps[topic] = now
+                    new_entries_added = True
+                # The timestamp cache mirrors the created_at column
+                rows.append((topic, current_hash, now, self._cache_timestamps.get(topic, now)))
+
+            if self._persist and rows:
+                assert self.db_path is not None
+                with connect(self.db_path) as conn:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO published_hashes
+                            (topic, hash, updated_at, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        rows,
+                    )
+                    conn.commit()
+                self._report_db_size()
 
-        # Check max entries if we added new entries
-        if new_entries_added:
-            self._enforce_max_entries()
+            # Check max entries if we added new entries
+            if new_entries_added:
+                self._enforce_max_entries()
 
     def clear(self) -> None:
         """Clear all stored hashes."""
-        self._cache.clear()
-        self._cache_timestamps.clear()
-        self._op_count = 0
-        if self._persist:
-            assert self.db_path is not None
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM published_hashes")
-                conn.commit()
-            self._report_db_size()
-        logger.info("Cleared published hashes")
+        with self._lock:
+            self._cache.clear()
+            self._cache_timestamps.clear()
+            self._op_count = 0
+            if self._persist:
+                assert self.db_path is not None
+                with connect(self.db_path) as conn:
+                    conn.execute("DELETE FROM published_hashes")
+                    conn.commit()
+                self._report_db_size()
+            logger.info("Cleared published hashes")
 
     def force_cleanup(self) -> int:
         """Force immediate cleanup of expired entries.
@@ -372,7 +377,8 @@ class LastPublishedHashes:
         Returns:
             Number of entries removed.
         """
-        return self._cleanup_expired()
+        with self._lock:
+            return self._cleanup_expired()
 
     @property
     def count(self) -> int:
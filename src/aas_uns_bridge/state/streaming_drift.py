@@ -16,7 +16,6 @@ import hashlib
 import logging
 import math
 import random
-import sqlite3
 import threading
 import time
 from dataclasses import dataclass, field
@@ -26,6 +25,7 @@ from typing import Any
 
 from aas_uns_bridge.domain.models import ContextMetric
 from aas_uns_bridge.observability.metrics import METRICS
+from aas_uns_bridge.state.db import connect, enable_wal
 
 logger = logging.getLogger(__name__)
 
@@ -331,7 +331,8 @@ class IncrementalDriftDetector:
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
+            enable_wal(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS drift_state (
                     asset_id TEXT PRIMARY KEY,
@@ -367,7 +368,7 @@ class IncrementalDriftDetector:
         Restores schema hash state from previous runs to prevent spurious
         drift alerts on daemon restarts.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT asset_id, schema_hash FROM drift_state WHERE schema_hash IS NOT NULL"
             )
@@ -652,7 +653,7 @@ class IncrementalDriftDetector:
         """Persist drift detection to database."""
         now = int(time.time() * 1000)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute(
                 """
                 INSERT INTO drift_history
@@ -703,7 +704,7 @@ class IncrementalDriftDetector:
         Returns:
             List of drift event dictionaries.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT timestamp_ms, drift_type, severity, confidence,
@@ -739,7 +740,7 @@ class IncrementalDriftDetector:
             self._forests.pop(asset_id, None)
             self._schema_hashes.pop(asset_id, None)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("DELETE FROM drift_state WHERE asset_id = ?", (asset_id,))
             conn.execute("DELETE FROM drift_history WHERE asset_id = ?", (asset_id,))
             conn.commit()
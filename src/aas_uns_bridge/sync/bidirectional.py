@@ -16,6 +16,8 @@ from __future__ import annotations
 import fnmatch
 import json
 import logging
+import os
+import re
 import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
@@ -33,6 +35,24 @@ logger = logging.getLogger(__name__)
 # Dedicated audit logger for structured compliance logging
 audit_logger: structlog.stdlib.BoundLogger = structlog.get_logger("aas_uns_bridge.audit")
 
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile glob patterns into one regex matching any of them.
+
+    Matches like ``fnmatch.fnmatch``, so callers must ``os.path.normcase``
+    the path being tested.
+
+    Args:
+        patterns: Glob patterns.
+
+    Returns:
+        Compiled alternation, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
 # Event type literals for audit logging
 AuditEvent = Literal[
     "write_command_received",
@@ -113,6 +133,8 @@ class BidirectionalSync:
         self._cmd_suffix = command_topic_suffix
         self._allowed = allowed_patterns or ["*"]
         self._denied = denied_patterns or []
+        self._allowed_re = _compile_globs(self._allowed)
+        self._denied_re = _compile_globs(self._denied)
         self._validate = validate_before_write
         self._publish_confirmations = publish_confirmations
         self._write_count = 0
@@ -342,21 +364,17 @@ class BidirectionalSync:
         errors: list[str] = []
         full_path = f"{cmd.submodel_id}/{cmd.property_path}"
 
+        match_path = os.path.normcase(full_path)
+
         # Check denied patterns first (explicit deny wins)
-        for pattern in self._denied:
-            if fnmatch.fnmatch(full_path, pattern):
-                errors.append(f"Path '{full_path}' matches denied pattern '{pattern}'")
-                METRICS.bidirectional_validations_total.labels(result="denied").inc()
-                return ValidationResult(is_valid=False, errors=errors)
+        if self._denied_re is not None and self._denied_re.match(match_path):
+            pattern = next(p for p in self._denied if fnmatch.fnmatch(full_path, p))
+            errors.append(f"Path '{full_path}' matches denied pattern '{pattern}'")
+            METRICS.bidirectional_validations_total.labels(result="denied").inc()
+            return ValidationResult(is_valid=False, errors=errors)
 
         # Check allowed patterns
-        allowed = False
-        for pattern in self._allowed:
-            if fnmatch.fnmatch(full_path, pattern):
-                allowed = True
-                break
-
-        if not allowed:
+        if self._allowed_re is None or not self._allowed_re.match(match_path):
             errors.append(f"Path '{full_path}' not in allowed patterns")
             METRICS.bidirectional_validations_total.labels(result="denied").inc()
             return ValidationResult(is_valid=False, errors=errors)
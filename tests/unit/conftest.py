@@ -0,0 +1,32 @@
+"""Shared fixtures for unit tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aas_uns_bridge.config import BridgeConfig
+from aas_uns_bridge.daemon import BridgeDaemon
+
+
+@pytest.fixture
+def make_daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., BridgeDaemon]:
+    """Return a factory for daemons that are constructed but not started.
+
+    Daemons keep their state under ``tmp_path``, watch no directory and leave
+    the global logging setup alone. Keyword arguments override top-level
+    config sections, e.g. ``make_daemon(uns={"enabled": False})``.
+    """
+    monkeypatch.setattr(BridgeDaemon, "_init_logging", lambda self: None)
+
+    def factory(**sections: dict[str, Any]) -> BridgeDaemon:
+        data: dict[str, dict[str, Any]] = {
+            "state": {"db_path": tmp_path / "state" / "bridge.db"},
+            "file_watcher": {"enabled": False, "watch_dir": tmp_path / "watch"},
+        }
+        for name, values in sections.items():
+            data[name] = {**data.get(name, {}), **values}
+        return BridgeDaemon(BridgeConfig.model_validate(data), tmp_path / "mappings.yaml")
+
+    return factory
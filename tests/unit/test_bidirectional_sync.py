@@ -1,5 +1,6 @@
 """Unit tests for bidirectional synchronization handler."""
 
+import fnmatch
 import json
 from unittest.mock import MagicMock, patch
 
@@ -386,6 +387,47 @@ class TestBidirectionalSyncValidation:
 
         assert not result.is_valid
 
+    def test_denied_error_names_matching_pattern(self, sync_handler: BidirectionalSync) -> None:
+        """Test that the rejection reports which denied pattern matched."""
+        cmd = WriteCommand(
+            topic="test/cmd/Identification/Serial",
+            submodel_id="Identification",
+            property_path="Serial",
+            value="X",
+        )
+
+        result = sync_handler._validate_write(cmd)
+
+        assert result.errors == [
+            "Path 'Identification/Serial' matches denied pattern 'Identification/*'"
+        ]
+
+    @pytest.mark.parametrize(
+        "path",
+        ["Setpoints/A", "Setpoints/A/B", "Configuration/x", "Line2/Setpoints/A", "readonly/A"],
+    )
+    def test_matching_agrees_with_fnmatch(
+        self, mock_mqtt_client: MagicMock, mock_aas_client: MagicMock, path: str
+    ) -> None:
+        """Test that compiled patterns accept exactly what fnmatch accepts."""
+        allowed = ["Setpoints/*", "Configuration/[a-z]", "Line?/*"]
+        sync = BidirectionalSync(
+            mqtt_client=mock_mqtt_client,
+            aas_client=mock_aas_client,
+            allowed_patterns=allowed,
+        )
+        submodel_id, property_path = path.split("/", 1)
+        cmd = WriteCommand(
+            topic=f"test/cmd/{path}",
+            submodel_id=submodel_id,
+            property_path=property_path,
+            value=1,
+        )
+
+        result = sync._validate_write(cmd)
+
+        assert result.is_valid == any(fnmatch.fnmatch(path, p) for p in allowed)
+
 
 class TestBidirectionalSyncExecution:
     """Tests for write execution."""
@@ -0,0 +1,117 @@
+"""Unit tests for configuration loading."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from aas_uns_bridge.config import (
+    BridgeConfig,
+    BridgeSettings,
+    SemanticConfig,
+    ValidationConfig,
+    load_config,
+)
+
+
+class TestFromYaml:
+    """Tests for loading BridgeConfig from YAML."""
+
+    def test_values_loaded(self, tmp_path: Path) -> None:
+        """Test that file values override defaults."""
+        path = tmp_path / "config.yaml"
+        path.write_text("mqtt:\n  host: broker\n  port: 8883\nsemantic:\n  sqos_level: 2\n")
+
+        config = BridgeConfig.from_yaml(path)
+
+        assert config.mqtt.host == "broker"
+        assert config.mqtt.port == 8883
+        assert config.semantic.use_user_properties is True
+        assert config.uns.enabled is True
+
+    def test_empty_file_uses_defaults(self, tmp_path: Path) -> None:
+        """Test that an empty file yields the default configuration."""
+        path = tmp_path / "config.yaml"
+        path.write_text("")
+
+        assert BridgeConfig.from_yaml(path) == BridgeConfig()
+
+    def test_utf8_content(self, tmp_path: Path) -> None:
+        """Test that non-ASCII values survive the byte-level read."""
+        path = tmp_path / "config.yaml"
+        path.write_text("sparkplug:\n  group_id: Fräsen\n", encoding="utf-8")
+
+        assert BridgeConfig.from_yaml(path).sparkplug.group_id == "Fräsen"
+
+    def test_unchanged_file_served_from_cache(self, tmp_path: Path) -> None:
+        """Test that reloading an unchanged file reuses the parsed result."""
+        path = tmp_path / "config.yaml"
+        path.write_text("mqtt:\n  host: broker\n")
+
+        with patch("aas_uns_bridge.config.yaml.load", wraps=yaml.load) as load:
+            first = BridgeConfig.from_yaml(path)
+            second = BridgeConfig.from_yaml(path)
+
+        assert load.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_modified_file_reloaded(self, tmp_path: Path) -> None:
+        """Test that a rewritten file is parsed again."""
+        path = tmp_path / "config.yaml"
+        path.write_text("mqtt:\n  host: first\n")
+        assert BridgeConfig.from_yaml(path).mqtt.host == "first"
+
+        path.write_text("mqtt:\n  host: second-broker\n")
+
+        assert BridgeConfig.from_yaml(path).mqtt.host == "second-broker"
+
+    def test_returned_copy_is_independent(self, tmp_path: Path) -> None:
+        """Test that mutating a loaded config does not affect later loads."""
+        path = tmp_path / "config.yaml"
+        path.write_text("mqtt:\n  host: broker\n")
+
+        BridgeConfig.from_yaml(path).mqtt.host = "changed"
+
+        assert BridgeConfig.from_yaml(path).mqtt.host == "broker"
+
+
+class TestLoadConfig:
+    """Tests for settings-driven configuration loading."""
+
+    def test_missing_file_uses_defaults(self, tmp_path: Path) -> None:
+        """Test that a missing config file falls back to defaults."""
+        settings = BridgeSettings(config_file=tmp_path / "missing.yaml")
+
+        assert load_config(settings) == BridgeConfig()
+
+
+class TestSemanticConfig:
+    """Tests for sQoS level enforcement."""
+
+    def test_level_one_enables_validation(self) -> None:
+        """Test that sQoS 1 enables validation and keeps other settings."""
+        config = SemanticConfig.model_validate(
+            {
+                "sqos_level": 1,
+                "validation": {
+                    "reject_invalid": True,
+                    "value_constraints": {"urn:temp": {"min": 0, "max": 100}},
+                },
+            }
+        )
+
+        assert config.validation.enabled is True
+        assert config.validation.reject_invalid is True
+        assert config.validation.value_constraints["urn:temp"].max == 100
+        assert config.use_user_properties is False
+
+    def test_supplied_validation_config_not_mutated(self) -> None:
+        """Test that enabling validation does not modify the caller's instance."""
+        validation = ValidationConfig()
+
+        config = SemanticConfig(sqos_level=2, validation=validation)
+
+        assert config.validation.enabled is True
+        assert config.use_user_properties is True
+        assert validation.enabled is False
@@ -0,0 +1,137 @@
+"""Unit tests for the daemon's periodic task scheduling."""
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from aas_uns_bridge import daemon as daemon_module
+from aas_uns_bridge.config import LifecycleConfig, RepoClientConfig
+from aas_uns_bridge.daemon import BridgeDaemon
+
+
+class FakeClock:
+    """Monotonic clock that advances only while the daemon waits.
+
+    Also stands in for the daemon's shutdown event, which is set once the
+    clock reaches ``stop_at``.
+    """
+
+    def __init__(self, stop_at: float) -> None:
+        self.now = 0.0
+        self.stop_at = stop_at
+        self._stopped = False
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def is_set(self) -> bool:
+        return self._stopped
+
+    def set(self) -> None:
+        self._stopped = True
+
+    def wait(self, timeout: float) -> bool:
+        if self._stopped:
+            return True
+        self.now += timeout
+        if self.now >= self.stop_at:
+            self._stopped = True
+        return self._stopped
+
+
+def run_until(
+    make_daemon: Callable[..., BridgeDaemon],
+    monkeypatch: pytest.MonkeyPatch,
+    stop_at: float,
+    poll_interval: float,
+    stale_threshold: int,
+) -> tuple[list[float], list[float]]:
+    """Run the daemon loop on a fake clock and record when each task ran."""
+    daemon = make_daemon(
+        repo_client={"enabled": True, "poll_interval_seconds": poll_interval},
+        semantic={"lifecycle": {"enabled": True, "stale_threshold_seconds": stale_threshold}},
+    )
+    clock = FakeClock(stop_at)
+    monkeypatch.setattr(daemon_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    polls: list[float] = []
+    stale_checks: list[float] = []
+    daemon._shutdown = clock  # type: ignore[assignment]
+    daemon.start = MagicMock()  # type: ignore[method-assign]
+    daemon.shutdown = MagicMock()  # type: ignore[method-assign]
+    daemon._poll_repository = lambda: polls.append(clock.now)  # type: ignore[method-assign]
+    daemon._check_stale_assets = lambda: stale_checks.append(clock.now)  # type: ignore[method-assign]
+
+    daemon.run()
+
+    daemon.start.assert_called_once()
+    daemon.shutdown.assert_called_once()
+    return polls, stale_checks
+
+
+class TestRunLoop:
+    """Tests for BridgeDaemon.run cadence."""
+
+    def test_polls_and_stale_checks_keep_own_intervals(
+        self, make_daemon: Callable[..., BridgeDaemon], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a short stale threshold does not speed up repository polling."""
+        polls, stale_checks = run_until(
+            make_daemon, monkeypatch, stop_at=2.0, poll_interval=10.0, stale_threshold=1
+        )
+
+        assert polls == []
+        assert stale_checks == [0.0, 0.5, 1.0, 1.5]
+
+    def test_repository_polled_each_interval(
+        self, make_daemon: Callable[..., BridgeDaemon], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the repository is polled on its own cadence after start."""
+        polls, stale_checks = run_until(
+            make_daemon, monkeypatch, stop_at=3.5, poll_interval=1.0, stale_threshold=100
+        )
+
+        assert polls == [1.0, 2.0, 3.0]
+        assert stale_checks == [0.0]
+
+    def test_shutdown_requested_during_poll(
+        self, make_daemon: Callable[..., BridgeDaemon], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a signal during a poll only stops the loop once the poll returns."""
+        daemon = make_daemon(repo_client={"enabled": True, "poll_interval_seconds": 1.0})
+        clock = FakeClock(stop_at=10.0)
+        monkeypatch.setattr(daemon_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+        daemon._shutdown = clock  # type: ignore[assignment]
+        daemon.start = MagicMock()  # type: ignore[method-assign]
+        daemon.shutdown = MagicMock()  # type: ignore[method-assign]
+        shut_down_during_poll: list[bool] = []
+
+        def poll() -> None:
+            daemon.request_shutdown()
+            shut_down_during_poll.append(daemon.shutdown.called)
+
+        daemon._poll_repository = poll  # type: ignore[method-assign]
+
+        daemon.run()
+
+        assert shut_down_during_poll == [False]
+        daemon.shutdown.assert_called_once()
+        assert clock.now == 1.0
+
+
+class TestIntervalBounds:
+    """Tests for the intervals the loop computes deadlines from."""
+
+    @pytest.mark.parametrize("interval", [0, -1])
+    def test_poll_interval_must_be_positive(self, interval: float) -> None:
+        """Test that a non-positive poll interval is rejected."""
+        with pytest.raises(ValidationError):
+            RepoClientConfig(poll_interval_seconds=interval)
+
+    @pytest.mark.parametrize("threshold", [0, -1])
+    def test_stale_threshold_must_be_positive(self, threshold: int) -> None:
+        """Test that a non-positive stale threshold is rejected."""
+        with pytest.raises(ValidationError):
+            LifecycleConfig(stale_threshold_seconds=threshold)
@@ -0,0 +1,60 @@
+"""Unit tests for the daemon's Prometheus metric recording."""
+
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+
+from aas_uns_bridge.daemon import BridgeDaemon
+from aas_uns_bridge.domain.models import ContextMetric
+from aas_uns_bridge.observability.metrics import METRICS
+from aas_uns_bridge.validation.semantic_validator import (
+    BatchValidationResult,
+    ErrorType,
+    ValidationError,
+    ValidationResult,
+)
+
+
+def make_result(errors: list[ErrorType]) -> ValidationResult:
+    """Build a validation result with one error per given type."""
+    metric = ContextMetric(path="A.B", value=1, aas_type="Property", value_type="xs:int")
+    return ValidationResult(
+        metric=metric,
+        errors=[ValidationError(error_type=e, message="bad", path="A.B") for e in errors],
+    )
+
+
+class TestRecordValidationMetrics:
+    """Tests for BridgeDaemon._record_validation_metrics."""
+
+    def test_counts_batched_per_label(self, make_daemon: Callable[..., BridgeDaemon]) -> None:
+        """Test that each label is incremented once with the batch total."""
+        daemon = make_daemon()
+        missing = ErrorType.MISSING_SEMANTIC_ID
+        result = BatchValidationResult(
+            results=[
+                make_result([]),
+                make_result([]),
+                make_result([missing]),
+                make_result([missing, ErrorType.VALUE_OUT_OF_RANGE]),
+            ]
+        )
+        children = {
+            "valid": MagicMock(),
+            "invalid": MagicMock(),
+            missing.value: MagicMock(),
+            ErrorType.VALUE_OUT_OF_RANGE.value: MagicMock(),
+        }
+        with (
+            patch.object(METRICS, "validation_metrics_total") as metrics_total,
+            patch.object(METRICS, "validation_errors_total") as errors_total,
+        ):
+            metrics_total.labels.side_effect = lambda result: children[result]
+            errors_total.labels.side_effect = lambda error_type: children[error_type]
+            daemon._record_validation_metrics(result)
+
+        assert {label: child.inc.call_args_list for label, child in children.items()} == {
+            "valid": [((2,),)],
+            "invalid": [((2,),)],
+            missing.value: [((2,),)],
+            ErrorType.VALUE_OUT_OF_RANGE.value: [((1,),)],
+        }
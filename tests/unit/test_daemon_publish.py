@@ -0,0 +1,90 @@
+"""Unit tests for publishing an object store from the daemon."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from aas_uns_bridge.aas.loader import load_json
+from aas_uns_bridge.daemon import BridgeDaemon
+from aas_uns_bridge.domain.models import ContextMetric
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def daemon(make_daemon: Callable[..., BridgeDaemon]) -> BridgeDaemon:
+    """Create a daemon that publishes UNS metrics to a mock publisher."""
+    instance = make_daemon(sparkplug={"enabled": False})
+    instance.uns_publisher = MagicMock()
+    return instance
+
+
+def fail_on_second_submodel(daemon: BridgeDaemon) -> None:
+    """Make topic building raise for the second submodel processed."""
+    build_topics = daemon.mapper.build_topics_for_submodel
+    calls = 0
+
+    def fail_second(*args: Any, **kwargs: Any) -> dict[str, ContextMetric]:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("mapping failed")
+        return build_topics(*args, **kwargs)
+
+    daemon.mapper.build_topics_for_submodel = fail_second  # type: ignore[method-assign]
+
+
+class TestProcessObjectStore:
+    """Tests for BridgeDaemon._process_object_store."""
+
+    def test_submodels_published_in_one_batch(self, daemon: BridgeDaemon) -> None:
+        """Test that changed metrics of all submodels are published together."""
+        object_store = load_json(FIXTURES_DIR / "sample_robot.json")
+
+        daemon._process_object_store(object_store, "robot.json")
+
+        daemon.uns_publisher.publish_batch.assert_called_once()
+        published = daemon.uns_publisher.publish_batch.call_args.args[0]
+        submodels = {topic.split("/")[3] for topic in published}
+        assert submodels == {"TechnicalData", "OperationalData"}
+        assert daemon.last_published.count == len(published)
+
+    def test_unchanged_store_not_republished(self, daemon: BridgeDaemon) -> None:
+        """Test that a second pass over the same content publishes nothing."""
+        object_store = load_json(FIXTURES_DIR / "sample_robot.json")
+        daemon._process_object_store(object_store, "robot.json")
+        daemon.uns_publisher.reset_mock()
+
+        daemon._process_object_store(object_store, "robot.json")
+
+        daemon.uns_publisher.publish_batch.assert_not_called()
+
+    def test_earlier_submodels_published_when_one_fails(self, daemon: BridgeDaemon) -> None:
+        """Test that a failing submodel does not drop changes collected before it."""
+        object_store = load_json(FIXTURES_DIR / "sample_robot.json")
+        fail_on_second_submodel(daemon)
+
+        with pytest.raises(RuntimeError, match="mapping failed"):
+            daemon._process_object_store(object_store, "robot.json")
+
+        daemon.uns_publisher.publish_batch.assert_called_once()
+        published = daemon.uns_publisher.publish_batch.call_args.args[0]
+        assert len({topic.split("/")[3] for topic in published}) == 1
+        assert daemon.last_published.count == len(published)
+        assert not daemon.last_published.filter_changed(published)
+
+    def test_partial_publish_failure_keeps_original_error(
+        self, daemon: BridgeDaemon, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a failing partial publish is logged, not raised in place of the cause."""
+        object_store = load_json(FIXTURES_DIR / "sample_robot.json")
+        fail_on_second_submodel(daemon)
+        daemon.uns_publisher.publish_batch.side_effect = ConnectionError("broker gone")
+
+        with pytest.raises(RuntimeError, match="mapping failed"):
+            daemon._process_object_store(object_store, "robot.json")
+
+        assert "broker gone" in caplog.text
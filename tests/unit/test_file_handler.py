@@ -0,0 +1,192 @@
+"""Unit tests for AAS file watching and change detection."""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from watchdog.events import FileModifiedEvent
+
+from aas_uns_bridge.daemon import AASFileHandler, BridgeDaemon
+
+
+class Recorder:
+    """Callback that records paths and signals each call."""
+
+    def __init__(self) -> None:
+        self.paths: list[Path] = []
+        self.called = threading.Event()
+
+    def __call__(self, path: Path) -> None:
+        self.paths.append(path)
+        self.called.set()
+
+
+def touch(tmp_path: Path, name: str) -> FileModifiedEvent:
+    """Create a file and return a modification event for it."""
+    path = tmp_path / name
+    path.write_text("{}")
+    return FileModifiedEvent(str(path))
+
+
+class TestAASFileHandler:
+    """Tests for AASFileHandler debouncing."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("robot.aasx", True),
+            ("Robot.AASX", True),
+            ("sensor.json", True),
+            ("shells.xml", True),
+            ("other.xml", False),
+            ("aasx", False),
+            ("notes.txt", False),
+            ("line_01.aas.xml", True),
+            ("line_1.aas.xml", False),
+        ],
+    )
+    def test_pattern_matching(self, name: str, expected: bool) -> None:
+        """Test glob and exact-name patterns, case-insensitively."""
+        patterns = ["*.aasx", "*.JSON", "shells.xml", "line_[0-9]?.aas.xml"]
+        handler = AASFileHandler(Recorder(), patterns, 1.0)
+
+        assert handler._matches_pattern(Path(name)) is expected
+
+    def test_no_patterns_match_nothing(self) -> None:
+        """Test that an empty pattern list does not match every file."""
+        handler = AASFileHandler(Recorder(), [], 1.0)
+
+        assert not handler._matches_pattern(Path("robot.aasx"))
+
+    def test_burst_of_events_fires_once(self, tmp_path: Path) -> None:
+        """Test that repeated events within the debounce window fire one callback."""
+        recorder = Recorder()
+        handler = AASFileHandler(recorder, ["*.json"], debounce_seconds=0.05)
+        event = touch(tmp_path, "aas.json")
+
+        for _ in range(20):
+            handler.on_any_event(event)
+        assert recorder.called.wait(2)
+        time.sleep(0.1)
+        handler.stop(timeout=1)
+
+        assert recorder.paths == [tmp_path / "aas.json"]
+        assert sum(t.name == "aasx-file-events" for t in threading.enumerate()) == 0
+
+    def test_each_path_fires_after_debounce(self, tmp_path: Path) -> None:
+        """Test that distinct paths are each processed after their delay."""
+        recorder = Recorder()
+        handler = AASFileHandler(recorder, ["*.json"], debounce_seconds=0.05)
+        events = [touch(tmp_path, f"aas{i}.json") for i in range(3)]
+
+        start = time.monotonic()
+        for event in events:
+            handler.on_any_event(event)
+        deadline = time.monotonic() + 2
+        while len(recorder.paths) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        handler.stop(timeout=1)
+
+        assert time.monotonic() - start >= 0.05
+        assert sorted(recorder.paths) == sorted(tmp_path / f"aas{i}.json" for i in range(3))
+
+    def test_event_after_callback_reschedules(self, tmp_path: Path) -> None:
+        """Test that a change after processing is picked up again."""
+        recorder = Recorder()
+        handler = AASFileHandler(recorder, ["*.json"], debounce_seconds=0.01)
+        event = touch(tmp_path, "aas.json")
+
+        handler.on_any_event(event)
+        assert recorder.called.wait(2)
+        recorder.called.clear()
+        handler.on_any_event(event)
+        assert recorder.called.wait(2)
+        handler.stop(timeout=1)
+
+        assert len(recorder.paths) == 2
+
+    def test_unmatched_and_deleted_files_ignored(self, tmp_path: Path) -> None:
+        """Test that other patterns and vanished files do not trigger callbacks."""
+        recorder = Recorder()
+        handler = AASFileHandler(recorder, ["*.aasx"], debounce_seconds=0.01)
+        handler.on_any_event(touch(tmp_path, "notes.txt"))
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / "gone.aasx")))
+
+        time.sleep(0.1)
+        handler.stop(timeout=1)
+
+        assert recorder.paths == []
+
+    @pytest.mark.parametrize(
+        ("recursive", "expected"),
+        [(True, ["a.aasx", "b.json", "sub/c.AASX"]), (False, ["a.aasx", "b.json"])],
+    )
+    def test_iter_matching_files(
+        self, tmp_path: Path, recursive: bool, expected: list[str]
+    ) -> None:
+        """Test that the startup scan finds each matching file once."""
+        (tmp_path / "sub").mkdir()
+        for name in ["a.aasx", "b.json", "notes.txt", "sub/c.AASX", "sub/d.txt"]:
+            (tmp_path / name).touch()
+        (tmp_path / "link").symlink_to(tmp_path / "sub")
+        handler = AASFileHandler(Recorder(), ["*.aasx", "*.json", "a.aasx"], 1.0)
+
+        found = handler.iter_matching_files(tmp_path, recursive)
+
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in found) == expected
+
+
+@pytest.fixture
+def daemon(make_daemon: Callable[..., BridgeDaemon]) -> BridgeDaemon:
+    """Create a daemon for file change detection."""
+    return make_daemon()
+
+
+def set_mtime(path: Path, seconds_ago: float) -> None:
+    """Backdate a file's modification time."""
+    mtime_ns = time.time_ns() - int(seconds_ago * 1e9)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestFileChangeDetection:
+    """Tests for BridgeDaemon._file_has_changed."""
+
+    def test_unchanged_stat_skips_hashing(self, daemon: BridgeDaemon, tmp_path: Path) -> None:
+        """Test that a file with settled, unchanged stat is not read again."""
+        path = tmp_path / "aas.json"
+        path.write_text("{}")
+        set_mtime(path, 60)
+
+        assert daemon._file_has_changed(path) is True
+        with patch.object(daemon, "_compute_file_hash") as compute:
+            assert daemon._file_has_changed(path) is False
+
+        compute.assert_not_called()
+
+    def test_recently_modified_file_is_rehashed(self, daemon: BridgeDaemon, tmp_path: Path) -> None:
+        """Test that a same-size rewrite within timestamp granularity is detected."""
+        path = tmp_path / "aas.json"
+        path.write_text('{"a": 1}')
+        stat = path.stat()
+        assert daemon._file_has_changed(path) is True
+
+        path.write_text('{"a": 2}')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert daemon._file_has_changed(path) is True
+
+    def test_touched_file_with_same_content_unchanged(
+        self, daemon: BridgeDaemon, tmp_path: Path
+    ) -> None:
+        """Test that a new mtime alone does not count as a change."""
+        path = tmp_path / "aas.json"
+        path.write_text("{}")
+        assert daemon._file_has_changed(path) is True
+
+        set_mtime(path, 30)
+
+        assert daemon._file_has_changed(path) is False
@@ -0,0 +1,60 @@
+"""Unit tests for content fingerprints."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from aas_uns_bridge.aas import fingerprint
+from aas_uns_bridge.aas.fingerprint import content_fingerprint, file_fingerprint
+
+
+class TestContentFingerprint:
+    """Tests for change-detection fingerprints."""
+
+    def test_equal_content_equal_fingerprint(self) -> None:
+        """Test that identical content yields identical fingerprints."""
+        assert content_fingerprint(b"payload") == content_fingerprint(b"payload")
+
+    def test_different_content_different_fingerprint(self) -> None:
+        """Test that changed content yields a different fingerprint."""
+        assert content_fingerprint(b"payload") != content_fingerprint(b"payload!")
+
+    def test_uses_xxh3_when_available(self) -> None:
+        """Test that XXH3-128 is used when xxhash is installed."""
+        xxhash = pytest.importorskip("xxhash")
+
+        assert content_fingerprint(b"payload") == xxhash.xxh3_128_hexdigest(b"payload")
+
+    def test_falls_back_to_sha256(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that SHA-256 is used without xxhash."""
+        monkeypatch.setattr(fingerprint, "xxhash", None)
+
+        assert content_fingerprint(b"payload") == hashlib.sha256(b"payload").hexdigest()
+
+
+class TestFileFingerprint:
+    """Tests for streamed file fingerprints."""
+
+    @pytest.mark.parametrize("use_xxhash", [True, False])
+    def test_matches_content_fingerprint(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_xxhash: bool
+    ) -> None:
+        """Test that a file spanning several chunks hashes like its bytes."""
+        if use_xxhash:
+            pytest.importorskip("xxhash")
+        else:
+            monkeypatch.setattr(fingerprint, "xxhash", None)
+        monkeypatch.setattr(fingerprint, "_FILE_CHUNK_SIZE", 7)
+        content = bytes(range(256)) * 3
+        path = tmp_path / "package.aasx"
+        path.write_bytes(content)
+
+        assert file_fingerprint(path) == content_fingerprint(content)
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Test that an empty file hashes like empty content."""
+        path = tmp_path / "empty.json"
+        path.touch()
+
+        assert file_fingerprint(path) == content_fingerprint(b"")
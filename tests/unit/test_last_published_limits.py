@@ -1,8 +1,11 @@
 """Unit tests for LastPublishedHashes size limits and TTL expiry."""
 
+import sqlite3
 import tempfile
+import threading
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -409,3 +412,55 @@ class TestLastPublishedHashesInMemory:
 
         # Should have enforced limit
         assert hashes.count <= 5
+
+
+class TestLastPublishedHashesBatches:
+    """Tests for batch filtering and updates."""
+
+    def test_large_batch_cleans_up_once(self, temp_db: Path) -> None:
+        """Verify a batch triggers at most one TTL scan however large it is."""
+        hashes = LastPublishedHashes(db_path=temp_db)
+        batch = {f"topic/{i}": make_metric(float(i)) for i in range(1000)}
+
+        with patch.object(hashes, "_cleanup_expired", wraps=hashes._cleanup_expired) as cleanup:
+            changed = hashes.filter_changed(batch)
+
+        assert cleanup.call_count == 1
+        assert changed == batch
+
+    def test_batch_update_keeps_created_at(self, temp_db: Path) -> None:
+        """Verify re-publishing a topic keeps its original creation time."""
+        hashes = LastPublishedHashes(db_path=temp_db)
+        hashes.update_batch({"topic/a": make_metric(1.0)})
+        created_at = hashes._cache_timestamps["topic/a"]
+
+        with patch("time.time", return_value=created_at + 100):
+            hashes.update_batch({"topic/a": make_metric(2.0)})
+
+        with sqlite3.connect(temp_db) as conn:
+            row = conn.execute(
+                "SELECT created_at, updated_at FROM published_hashes WHERE topic = 'topic/a'"
+            ).fetchone()
+        assert row == (created_at, created_at + 100)
+
+
+class TestLastPublishedHashesConcurrency:
+    """Tests for concurrent access from ingestion threads."""
+
+    def test_concurrent_batches_persist_every_topic(self, temp_db: Path) -> None:
+        """Test that batches from parallel threads are all recorded without errors."""
+        hashes = LastPublishedHashes(temp_db, max_entries=10_000)
+
+        def publish(worker: int) -> None:
+            for batch in range(10):
+                topics = {f"w{worker}/b{batch}/m{i}": make_metric(float(i)) for i in range(20)}
+                hashes.update_batch(hashes.filter_changed(topics))
+
+        threads = [threading.Thread(target=publish, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hashes.count == 4 * 10 * 20
+        assert LastPublishedHashes(temp_db, max_entries=10_000).count == 4 * 10 * 20
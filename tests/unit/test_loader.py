@@ -0,0 +1,170 @@
+"""Unit tests for AAS file loaders."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from basyx.aas import model
+from basyx.aas.adapter import aasx
+
+from aas_uns_bridge.aas import loader
+from aas_uns_bridge.aas.loader import (
+    AASLoadError,
+    _sniff_json_value,
+    iter_aasx,
+    load_aasx,
+    load_json,
+)
+from aas_uns_bridge.aas.traversal import flatten_submodel, iter_submodels
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+class TestSniffJsonValue:
+    """Tests for top-level JSON value detection."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (b'{"submodels": []}', b"{"),
+            (b"[]", b"["),
+            (b"  \n\t {}", b"{"),
+            (b"\xef\xbb\xbf[1]", b"["),
+            (b"42", b"4"),
+            (b"", b""),
+            (b"   \n", b""),
+        ],
+    )
+    def test_sniff_opening_byte(self, tmp_path: Path, content: bytes, expected: bytes) -> None:
+        """Test that the opening byte is found after whitespace and BOM."""
+        path = tmp_path / "aas.json"
+        path.write_bytes(content)
+
+        assert _sniff_json_value(path) == expected
+
+    def test_sniff_skips_long_leading_whitespace(self, tmp_path: Path) -> None:
+        """Test that whitespace longer than one read chunk is skipped."""
+        path = tmp_path / "aas.json"
+        path.write_bytes(b" " * 2000 + b"{}")
+
+        assert _sniff_json_value(path) == b"{"
+
+
+class TestLoadJson:
+    """Tests for loading AAS JSON files."""
+
+    def test_load_environment(self) -> None:
+        """Test loading an environment file."""
+        object_store = load_json(FIXTURES_DIR / "sample_sensor.json")
+
+        assert len(object_store) == 2
+
+    def test_scalar_document_rejected(self, tmp_path: Path) -> None:
+        """Test that a scalar top-level value is rejected."""
+        path = tmp_path / "aas.json"
+        path.write_text("42")
+
+        with pytest.raises(AASLoadError, match="Unexpected JSON structure"):
+            load_json(path)
+
+    def test_invalid_json_rejected(self, tmp_path: Path) -> None:
+        """Test that malformed JSON raises AASLoadError."""
+        path = tmp_path / "aas.json"
+        path.write_text('{"submodels": [')
+
+        with pytest.raises(AASLoadError, match="Invalid JSON"):
+            load_json(path)
+
+
+class TestStreamingLoad:
+    """Tests for incremental JSON loading with ijson."""
+
+    @pytest.fixture(autouse=True)
+    def require_ijson(self) -> None:
+        """Skip when the optional ijson dependency is missing."""
+        pytest.importorskip("ijson")
+
+    @pytest.mark.parametrize("fixture", ["sample_sensor.json", "sample_robot.json"])
+    def test_streaming_matches_basyx_reader(
+        self, fixture: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that streamed objects match the BaSyx reader's output."""
+        path = FIXTURES_DIR / fixture
+        streamed = load_json(path)
+        monkeypatch.setattr(loader, "ijson", None)
+        eager = load_json(path)
+
+        def flattened(store: object) -> list[tuple[str, object, str]]:
+            return sorted(
+                (m.path, m.value, m.value_type)
+                for sm, _ in iter_submodels(store)
+                for m in flatten_submodel(sm)
+            )
+
+        assert sorted(obj.id for obj in streamed) == sorted(obj.id for obj in eager)
+        assert flattened(streamed) == flattened(eager)
+
+    def test_duplicate_identifiers_skipped(self, tmp_path: Path) -> None:
+        """Test that a repeated identifier keeps the first object."""
+        path = tmp_path / "aas.json"
+        submodels = [
+            {"modelType": "Submodel", "id": "urn:sm:1", "idShort": id_short}
+            for id_short in ("First", "Second")
+        ]
+        path.write_text(json.dumps({"submodels": submodels}))
+
+        object_store = load_json(path)
+
+        assert [obj.id_short for obj in object_store] == ["First"]
+
+    def test_truncated_json_rejected(self, tmp_path: Path) -> None:
+        """Test that truncated documents raise AASLoadError."""
+        path = tmp_path / "aas.json"
+        path.write_text('{"submodels": [{"modelType": "Submodel"')
+
+        with pytest.raises(AASLoadError, match="Invalid JSON"):
+            load_json(path)
+
+
+@pytest.fixture
+def aasx_package(tmp_path: Path) -> Path:
+    """Write the sample robot environment as an AASX package."""
+    object_store = load_json(FIXTURES_DIR / "sample_robot.json")
+    shells = [obj.id for obj in object_store if isinstance(obj, model.AssetAdministrationShell)]
+    path = tmp_path / "robot.aasx"
+    with aasx.AASXWriter(str(path)) as writer:
+        writer.write_aas(shells, object_store, aasx.DictSupplementaryFileContainer())
+    return path
+
+
+class TestIterAasx:
+    """Tests for streaming AASX ingestion."""
+
+    def test_yields_same_objects_as_eager_load(self, aasx_package: Path) -> None:
+        """Test that streamed objects match those of load_aasx."""
+        streamed = sorted(obj.id for obj in iter_aasx(aasx_package))
+
+        assert streamed
+        assert streamed == sorted(obj.id for obj in load_aasx(aasx_package))
+
+    def test_early_close_stops_reader(self, aasx_package: Path) -> None:
+        """Test that abandoning the iterator does not leave the reader running."""
+        objects = iter_aasx(aasx_package)
+        next(objects)
+        objects.close()
+
+        assert not any(t.name.startswith("aasx-reader-") for t in threading.enumerate())
+
+    def test_missing_file_rejected(self, tmp_path: Path) -> None:
+        """Test that a missing package raises before iteration starts."""
+        with pytest.raises(AASLoadError, match="not found"):
+            iter_aasx(tmp_path / "missing.aasx")
+
+    def test_invalid_package_rejected(self, tmp_path: Path) -> None:
+        """Test that a corrupt package raises AASLoadError while iterating."""
+        path = tmp_path / "broken.aasx"
+        path.write_bytes(b"not a zip archive")
+
+        with pytest.raises(AASLoadError, match="Failed to load AASX"):
+            list(iter_aasx(path))
@@ -0,0 +1,539 @@
+"""Unit tests for the AAS Repository REST client."""
+
+import asyncio
+import base64
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from basyx.aas import model
+
+from aas_uns_bridge.aas import repo_client
+from aas_uns_bridge.aas.repo_client import (
+    SYNC_POOL_LIMITS,
+    AASRepoClient,
+    AASRepoClientError,
+    decode_json,
+    encode_id,
+    encode_json,
+    resolve_http2,
+)
+from aas_uns_bridge.config import RepoClientConfig
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "sample_sensor.json"
+
+
+def encode(identifier: str) -> str:
+    """Base64URL-encode an identifier the way the API expects."""
+    return base64.urlsafe_b64encode(identifier.encode()).decode().rstrip("=")
+
+
+@pytest.fixture
+def environment() -> dict[str, Any]:
+    """Load the sample sensor environment."""
+    data: dict[str, Any] = json.loads(FIXTURE.read_text())
+    return data
+
+
+def make_routes(environment: dict[str, Any]) -> dict[str, Any]:
+    """Map API paths to response bodies for the sample environment."""
+    shells = environment["assetAdministrationShells"]
+    submodels = environment["submodels"]
+    routes: dict[str, Any] = {
+        "/shells": {"result": [{"id": s["id"]} for s in shells]},
+        "/submodels": [{"id": sm["id"]} for sm in submodels],
+    }
+    for shell in shells:
+        routes[f"/shells/{encode(shell['id'])}"] = shell
+    for sm in submodels:
+        routes[f"/submodels/{encode(sm['id'])}"] = sm
+    return routes
+
+
+def make_client(handler: Callable[[httpx.Request], Any], **config: Any) -> AASRepoClient:
+    """Create a repository client whose requests are served by ``handler``."""
+    transport = httpx.MockTransport(handler)
+    client = AASRepoClient(RepoClientConfig(enabled=True, base_url="http://repo", **config))
+    client._client = httpx.Client(base_url=client.base_url, transport=transport)
+    client._make_async_client = lambda concurrency: httpx.AsyncClient(  # type: ignore[method-assign]
+        base_url=client.base_url, transport=transport
+    )
+    return client
+
+
+class TestEncodeId:
+    """Tests for identifier encoding."""
+
+    def test_encode_id_is_unpadded_base64url(self) -> None:
+        """Test that identifiers are Base64URL encoded without padding."""
+        assert encode_id("https://example.com/sm/1") == encode("https://example.com/sm/1")
+        assert "=" not in encode_id("a")
+
+    def test_encode_id_is_memoized(self) -> None:
+        """Test that repeated identifiers hit the cache."""
+        encode_id.cache_clear()
+        encode_id("urn:example:sm")
+        encode_id("urn:example:sm")
+
+        assert encode_id.cache_info().hits == 1
+
+
+class TestFetchAll:
+    """Tests for fetching all repository content."""
+
+    def test_fetch_all_decodes_shells_and_submodels(self, environment: dict[str, Any]) -> None:
+        """Test that shells and submodels are decoded into the object store."""
+        routes = make_routes(environment)
+        client = make_client(lambda request: httpx.Response(200, json=routes[request.url.path]))
+
+        object_store, changed = client.fetch_all()
+
+        assert changed is True
+        assert len(object_store) == 2
+        types = {type(obj) for obj in object_store}
+        assert types == {model.AssetAdministrationShell, model.Submodel}
+
+    def test_fetch_all_unchanged_on_second_poll(self, environment: dict[str, Any]) -> None:
+        """Test that identical content is reported as unchanged."""
+        routes = make_routes(environment)
+        client = make_client(lambda request: httpx.Response(200, json=routes[request.url.path]))
+
+        client.fetch_all()
+        object_store, changed = client.fetch_all()
+
+        assert changed is False
+        assert len(object_store) == 2
+
+    def test_fetch_all_raises_on_http_error(self, environment: dict[str, Any]) -> None:
+        """Test that a failing submodel request fails the whole fetch."""
+        routes = make_routes(environment)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.startswith("/submodels/"):
+                return httpx.Response(500)
+            return httpx.Response(200, json=routes[request.url.path])
+
+        client = make_client(handler)
+
+        with pytest.raises(AASRepoClientError, match="Failed to get submodel"):
+            client.fetch_all()
+
+    def test_afetch_all_bounds_concurrency(self) -> None:
+        """Test that no more than the configured number of requests are in flight."""
+        ids = [f"urn:sm:{i}" for i in range(12)]
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            path = request.url.path
+            if path == "/shells":
+                return httpx.Response(200, json=[])
+            if path == "/submodels":
+                return httpx.Response(200, json=[{"id": i} for i in ids])
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"modelType": "Submodel", "id": path})
+
+        client = make_client(handler, max_concurrent_requests=3)
+
+        object_store, _ = asyncio.run(client.afetch_all())
+
+        assert peak == 3
+        assert len(object_store) == 12
+
+    def test_fetch_all_reuses_async_client(self, environment: dict[str, Any]) -> None:
+        """Test that successive polls share one event loop and async client."""
+        routes = make_routes(environment)
+        client = make_client(lambda request: httpx.Response(200, json=routes[request.url.path]))
+        make_async_client = client._make_async_client
+        created: list[httpx.AsyncClient] = []
+
+        def record(concurrency: int) -> httpx.AsyncClient:
+            created.append(make_async_client(concurrency))
+            return created[-1]
+
+        client._make_async_client = record  # type: ignore[method-assign]
+
+        client.fetch_all()
+        client.fetch_all()
+        client.close()
+
+        assert len(created) == 1
+        assert created[0].is_closed
+
+    def test_close_during_fetch_all_is_deferred(self, environment: dict[str, Any]) -> None:
+        """Test that a close from inside the running poll waits for it to return."""
+        routes = make_routes(environment)
+        client: AASRepoClient
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            # What a signal handler interrupting the poll would do
+            client.close()
+            return httpx.Response(200, json=routes[request.url.path])
+
+        client = make_client(handler)
+        make_async_client = client._make_async_client
+        created: list[httpx.AsyncClient] = []
+
+        def record(concurrency: int) -> httpx.AsyncClient:
+            created.append(make_async_client(concurrency))
+            return created[-1]
+
+        client._make_async_client = record  # type: ignore[method-assign]
+
+        object_store, _ = client.fetch_all()
+
+        assert len(object_store) == 2
+        assert created[0].is_closed
+        assert client._runner is None
+
+    def test_fetch_all_rejected_inside_event_loop(self) -> None:
+        """Test that the sync wrapper fails clearly when called from async code."""
+        client = make_client(lambda request: httpx.Response(200, json=[]))
+
+        async def poll() -> None:
+            client.fetch_all()
+
+        with pytest.raises(RuntimeError, match="await afetch_all"):
+            asyncio.run(poll())
+
+    def test_failed_listing_cancels_the_other(self) -> None:
+        """Test that a failing listing does not leave its sibling running."""
+        cancelled = False
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal cancelled
+            if request.url.path == "/shells":
+                return httpx.Response(500)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return httpx.Response(200, json=[])
+
+        client = make_client(handler)
+
+        async def poll() -> bool:
+            with pytest.raises(AASRepoClientError, match="Failed to list shells"):
+                await client.afetch_all()
+            return cancelled
+
+        assert asyncio.run(poll())
+
+
+class TestConditionalGet:
+    """Tests for ETag-based conditional requests."""
+
+    def test_not_modified_reuses_previous_payload(self, environment: dict[str, Any]) -> None:
+        """Test that a 304 response reuses the cached body and reports no change."""
+        routes = make_routes(environment)
+        conditional: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            etag = f'"{request.url.path}"'
+            if request.headers.get("If-None-Match") == etag:
+                conditional.append(request.url.path)
+                return httpx.Response(304)
+            return httpx.Response(200, json=routes[request.url.path], headers={"ETag": etag})
+
+        client = make_client(handler)
+
+        _, first_changed = client.fetch_all()
+        object_store, changed = client.fetch_all()
+
+        assert first_changed is True
+        assert changed is False
+        assert len(object_store) == 2
+        assert sorted(conditional) == sorted(routes)
+
+    def test_no_conditional_header_without_etag(self, environment: dict[str, Any]) -> None:
+        """Test that If-None-Match is only sent once an ETag is known."""
+        routes = make_routes(environment)
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(200, json=routes[request.url.path])
+
+        client = make_client(handler)
+        client.fetch_all()
+        client.fetch_all()
+
+        assert seen == [None] * 8
+
+    @staticmethod
+    def etag_handler(routes: dict[str, Any]) -> Callable[[httpx.Request], httpx.Response]:
+        """Serve routes with content-derived ETags, answering 304 when one matches."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = routes[request.url.path]
+            etag = f'"{encode(json.dumps(body, sort_keys=True))}"'
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304)
+            return httpx.Response(200, json=body, headers={"ETag": etag})
+
+        return handler
+
+    def test_only_listing_bodies_kept(self, environment: dict[str, Any]) -> None:
+        """Test that shell and submodel bodies are not held besides their objects."""
+        client = make_client(self.etag_handler(make_routes(environment)))
+
+        client.fetch_all()
+
+        assert set(client._last_payload) == {"/shells", "/submodels"}
+        assert len(client._decoded) == 2
+
+    def test_unlisted_objects_forgotten(self, environment: dict[str, Any]) -> None:
+        """Test that state for objects that leave the listing is evicted."""
+        routes = make_routes(environment)
+        client = make_client(self.etag_handler(routes))
+        client.fetch_all()
+        removed = f"/submodels/{encode(environment['submodels'][0]['id'])}"
+        routes["/submodels"] = []
+
+        object_store, _ = client.fetch_all()
+
+        assert len(object_store) == 1
+        assert removed not in client._decoded
+        assert removed not in client._etags
+
+    def test_get_submodel_returns_body_after_poll(self, environment: dict[str, Any]) -> None:
+        """Test that direct reads are unconditional, as their bodies are not kept."""
+        client = make_client(self.etag_handler(make_routes(environment)))
+        client.fetch_all()
+        submodel = environment["submodels"][0]
+
+        data, _ = client.get_submodel(submodel["id"])
+
+        assert data["id"] == submodel["id"]
+
+
+class TestHasChanged:
+    """Tests for change detection."""
+
+    def test_etag_skips_content_hash(self) -> None:
+        """Test that the content is not hashed when an ETag is present."""
+        client = AASRepoClient(RepoClientConfig())
+        response = httpx.Response(200, content=b"{}", headers={"ETag": '"v1"'})
+
+        with patch.object(client, "_compute_hash") as compute_hash:
+            assert client._has_changed("/submodels/x", response) is True
+            assert client._has_changed("/submodels/x", response) is False
+
+        compute_hash.assert_not_called()
+
+    def test_etag_change_is_detected(self) -> None:
+        """Test that a new ETag is reported as a change."""
+        client = AASRepoClient(RepoClientConfig())
+        client._has_changed("/shells/x", httpx.Response(200, headers={"ETag": '"v1"'}))
+
+        assert client._has_changed("/shells/x", httpx.Response(200, headers={"ETag": '"v2"'}))
+
+    def test_hash_fallback_without_etag(self) -> None:
+        """Test that content hashing is used when no ETag is sent."""
+        client = AASRepoClient(RepoClientConfig())
+
+        assert client._has_changed("/shells/x", httpx.Response(200, content=b"a")) is True
+        assert client._has_changed("/shells/x", httpx.Response(200, content=b"a")) is False
+        assert client._has_changed("/shells/x", httpx.Response(200, content=b"b")) is True
+
+
+class TestResolveHttp2:
+    """Tests for HTTP/2 opt-in."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that HTTP/2 stays off unless requested."""
+        assert resolve_http2(False) is False
+
+    def test_falls_back_without_h2(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a missing h2 package falls back to HTTP/1.1 with a warning."""
+        with patch("importlib.util.find_spec", return_value=None):
+            assert resolve_http2(True) is False
+
+        assert "h2" in caplog.text
+
+    def test_enabled_when_h2_available(self) -> None:
+        """Test that HTTP/2 is enabled when h2 can be imported."""
+        with patch("importlib.util.find_spec", return_value=object()):
+            assert resolve_http2(True) is True
+
+
+class TestDecodedCache:
+    """Tests for reuse of decoded objects across polls."""
+
+    def test_unchanged_objects_not_decoded_again(self, environment: dict[str, Any]) -> None:
+        """Test that unchanged payloads reuse the previously decoded objects."""
+        routes = make_routes(environment)
+        client = make_client(lambda request: httpx.Response(200, json=routes[request.url.path]))
+        first, _ = client.fetch_all()
+
+        with patch.object(client, "_decode", wraps=client._decode) as decode:
+            second, changed = client.fetch_all()
+
+        assert changed is False
+        decode.assert_not_called()
+        assert {id(obj) for obj in second} == {id(obj) for obj in first}
+
+    def test_changed_object_decoded_again(self, environment: dict[str, Any]) -> None:
+        """Test that only the changed payload is decoded again."""
+        routes = make_routes(environment)
+        client = make_client(lambda request: httpx.Response(200, json=routes[request.url.path]))
+        client.fetch_all()
+        submodel = environment["submodels"][0]
+        routes[f"/submodels/{encode(submodel['id'])}"] = {**submodel, "idShort": "Renamed"}
+
+        with patch.object(client, "_decode", wraps=client._decode) as decode:
+            object_store, changed = client.fetch_all()
+
+        assert changed is True
+        assert decode.call_count == 1
+        assert "Renamed" in {obj.id_short for obj in object_store}
+
+    @pytest.mark.parametrize("etags", [True, False], ids=["etag", "hash"])
+    def test_undecodable_object_unchanged_on_later_polls(
+        self, environment: dict[str, Any], etags: bool
+    ) -> None:
+        """Test that an unchanged payload that fails to decode is not a change."""
+        routes = make_routes(environment)
+        routes["/submodels"].append({"id": "urn:example:bad"})
+        routes[f"/submodels/{encode('urn:example:bad')}"] = {"id": "urn:example:bad"}
+        client = make_client(
+            TestConditionalGet.etag_handler(routes)
+            if etags
+            else lambda request: httpx.Response(200, json=routes[request.url.path])
+        )
+
+        polls = [client.fetch_all() for _ in range(3)]
+
+        assert [changed for _, changed in polls] == [True, False, False]
+        assert all(len(object_store) == 2 for object_store, _ in polls)
+
+
+class TestJsonCodec:
+    """Tests for the JSON codec used for request and response bodies."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def codec(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+        """Run each test with orjson (if installed) and the stdlib fallback."""
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(repo_client, "orjson", None)
+        return str(request.param)
+
+    def test_round_trip(self, codec: str) -> None:
+        """Test that values survive encoding and decoding."""
+        value = {"a": [1, 2.5, "x", None, True], "b": {"c": "ü"}}
+
+        assert decode_json(encode_json(value)) == value
+
+    def test_big_integers(self, codec: str) -> None:
+        """Test that integers beyond 64 bits are still supported."""
+        assert decode_json(encode_json(2**70)) == 2**70
+
+    def test_invalid_json_raises(self, codec: str) -> None:
+        """Test that malformed content raises JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            decode_json(b"{not json")
+
+
+class TestPoolLimits:
+    """Tests for connection pool sizing."""
+
+    def test_async_client_pool_matches_concurrency(self) -> None:
+        """Test that the async pool allows exactly the requested concurrency."""
+        client = AASRepoClient(RepoClientConfig())
+
+        with patch("httpx.AsyncClient") as async_client:
+            client._make_async_client(8)
+
+        limits = async_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 8
+        assert limits.keepalive_expiry == 300.0
+
+    def test_sync_client_keeps_one_connection(self) -> None:
+        """Test that the sync client keeps a single long-lived connection."""
+        with patch("httpx.Client") as sync_client:
+            AASRepoClient(RepoClientConfig())
+
+        assert sync_client.call_args.kwargs["limits"] == SYNC_POOL_LIMITS
+        assert SYNC_POOL_LIMITS.max_connections == 1
+        assert SYNC_POOL_LIMITS.keepalive_expiry == 300.0
+
+
+class TestListingCache:
+    """Tests for TTL caching of shell and submodel listings."""
+
+    @staticmethod
+    def counting_client(
+        environment: dict[str, Any], **config: Any
+    ) -> tuple[AASRepoClient, list[str], dict[str, Any]]:
+        """Create a client that records every requested path."""
+        routes = make_routes(environment)
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            if request.url.path not in routes:
+                return httpx.Response(404)
+            return httpx.Response(200, json=routes[request.url.path])
+
+        return make_client(handler, **config), requested, routes
+
+    def test_listings_fetched_every_poll_by_default(self, environment: dict[str, Any]) -> None:
+        """Test that caching is off unless a TTL is configured."""
+        client, requested, _ = self.counting_client(environment)
+
+        client.fetch_all()
+        client.fetch_all()
+
+        assert requested.count("/shells") == 2
+        assert requested.count("/submodels") == 2
+
+    def test_listings_reused_within_ttl(self, environment: dict[str, Any]) -> None:
+        """Test that listings are not requested again before the TTL expires."""
+        client, requested, _ = self.counting_client(environment, descriptor_cache_ttl_seconds=60.0)
+
+        client.fetch_all()
+        client.fetch_all()
+        client.list_submodels()
+
+        assert requested.count("/shells") == 1
+        assert requested.count("/submodels") == 1
+
+    def test_listings_refetched_after_ttl(self, environment: dict[str, Any]) -> None:
+        """Test that an expired listing is requested again."""
+        client, requested, _ = self.counting_client(environment, descriptor_cache_ttl_seconds=60.0)
+
+        with patch("time.monotonic", return_value=1000.0):
+            client.list_shells()
+        with patch("time.monotonic", return_value=1060.0):
+            client.list_shells()
+
+        assert requested.count("/shells") == 2
+
+    def test_failed_get_invalidates_listings(self, environment: dict[str, Any]) -> None:
+        """Test that a deleted object forces the listings to be fetched again."""
+        client, requested, routes = self.counting_client(
+            environment, descriptor_cache_ttl_seconds=60.0
+        )
+        client.fetch_all()
+        submodel_id = environment["submodels"][0]["id"]
+        del routes[f"/submodels/{encode(submodel_id)}"]
+        routes["/submodels"] = []
+
+        with pytest.raises(AASRepoClientError):
+            client.fetch_all()
+        object_store, _ = client.fetch_all()
+
+        assert requested.count("/submodels") == 2
+        assert [type(obj) for obj in object_store] == [model.AssetAdministrationShell]
@@ -0,0 +1,195 @@
+"""Unit tests for the write-capable AAS repository client."""
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from aas_uns_bridge.aas.repo_client import encode_id
+from aas_uns_bridge.aas.repository_client import (
+    AasRepositoryClient,
+    AasWriteError,
+    _element_url,
+    _value_url,
+    retry_with_backoff,
+)
+
+
+def make_client(handler: Callable[[httpx.Request], Any]) -> AasRepositoryClient:
+    """Create a write client whose requests are served by ``handler``."""
+    transport = httpx.MockTransport(handler)
+    client = AasRepositoryClient("http://repo")
+    client._client = httpx.Client(base_url="http://repo", transport=transport)
+    client._make_async_client = lambda concurrency: httpx.AsyncClient(  # type: ignore[method-assign]
+        base_url="http://repo", transport=transport
+    )
+    return client
+
+
+def value_url(submodel_id: str, property_path: str) -> str:
+    """Build the $value path for a property."""
+    return f"/submodels/{encode_id(submodel_id)}/submodel-elements/{property_path}/$value"
+
+
+class TestUpdatePropertiesBatch:
+    """Tests for concurrent batched writes."""
+
+    def test_all_updates_written(self) -> None:
+        """Test that every update is sent with its JSON value."""
+        written: dict[str, Any] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            written[request.url.path] = json.loads(request.content)
+            return httpx.Response(204)
+
+        client = make_client(handler)
+        updates = [("urn:sm:1", f"Setpoints.P{i}", i) for i in range(5)]
+
+        results = client.update_properties_batch(updates)
+
+        assert results == [None] * 5
+        assert written == {value_url(sm, path): value for sm, path, value in updates}
+
+    def test_failures_reported_per_update(self) -> None:
+        """Test that a client error fails only its own update."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("Missing/$value"):
+                return httpx.Response(404, text="not found")
+            return httpx.Response(204)
+
+        client = make_client(handler)
+
+        results = client.update_properties_batch(
+            [("urn:sm:1", "Setpoints.A", 1), ("urn:sm:1", "Missing", 2)]
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], AasWriteError)
+        assert results[1].status_code == 404
+
+    def test_transient_errors_retried(self) -> None:
+        """Test that 503 responses are retried before succeeding."""
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(503 if attempts < 3 else 204)
+
+        client = make_client(handler)
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            results = client.update_properties_batch([("urn:sm:1", "Setpoints.A", 1)])
+
+        assert results == [None]
+        assert attempts == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0]
+
+    @pytest.mark.parametrize("status", [500, 503])
+    def test_exhausted_retries_return_error(self, status: int) -> None:
+        """Test that persistent server errors are returned after all retries."""
+        client = make_client(lambda request: httpx.Response(status))
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            results = client.update_properties_batch([("urn:sm:1", "Setpoints.A", 1)])
+
+        assert isinstance(results[0], AasWriteError)
+        assert results[0].status_code == status
+
+    def test_rejected_inside_event_loop(self) -> None:
+        """Test that the sync wrapper fails clearly when called from async code."""
+        client = make_client(lambda request: httpx.Response(204))
+
+        async def write() -> None:
+            client.update_properties_batch([("urn:sm:1", "Setpoints.A", 1)])
+
+        with pytest.raises(RuntimeError, match="await aupdate_properties"):
+            asyncio.run(write())
+
+
+class TestRetryWithBackoff:
+    """Tests for the synchronous retry decorator."""
+
+    @staticmethod
+    def flaky(statuses: list[int | None]) -> Callable[[], str]:
+        """Build a write that fails with each status in turn, then succeeds."""
+        remaining = list(statuses)
+
+        @retry_with_backoff(max_retries=3)
+        def write() -> str:
+            if remaining:
+                raise AasWriteError("write failed", remaining.pop(0))
+            return "ok"
+
+        return write
+
+    def test_success_does_not_sleep(self) -> None:
+        """Test that a first-attempt success takes the fast path."""
+        with patch("time.sleep") as sleep:
+            assert self.flaky([])() == "ok"
+
+        sleep.assert_not_called()
+
+    def test_transient_errors_backoff(self) -> None:
+        """Test that transient errors are retried with exponential delays."""
+        with patch("time.sleep") as sleep:
+            assert self.flaky([503, None])() == "ok"
+
+        assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0]
+
+    def test_client_error_not_retried(self) -> None:
+        """Test that a 4xx error is raised immediately."""
+        with patch("time.sleep") as sleep, pytest.raises(AasWriteError) as exc_info:
+            self.flaky([404])()
+
+        assert exc_info.value.status_code == 404
+        sleep.assert_not_called()
+
+    def test_last_error_raised_when_exhausted(self) -> None:
+        """Test that the final error is raised after all attempts fail."""
+        with patch("time.sleep"), pytest.raises(AasWriteError) as exc_info:
+            self.flaky([500, 502, 504])()
+
+        assert exc_info.value.status_code == 504
+
+
+class TestUrlBuilding:
+    """Tests for memoized API path construction."""
+
+    def test_value_and_element_paths(self) -> None:
+        """Test that element and $value paths follow the DotAAS layout."""
+        encoded = encode_id("urn:sm:1")
+        assert _element_url("urn:sm:1", "A.B") == f"/submodels/{encoded}/submodel-elements/A.B"
+        assert _value_url("urn:sm:1", "A.B") == value_url("urn:sm:1", "A.B")
+
+    def test_get_property_uses_value_path(self) -> None:
+        """Test that reads hit the $value endpoint of the property."""
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.raw_path.decode())
+            return httpx.Response(200, json=21.5)
+
+        client = make_client(handler)
+
+        assert client.get_property("urn:sm:1", "Setpoints.Temp") == 21.5
+        assert paths == [value_url("urn:sm:1", "Setpoints.Temp")]
+
+
+class TestPoolLimits:
+    """Tests for the write client's connection pool."""
+
+    def test_sync_pool_allows_concurrent_writes(self) -> None:
+        """Test that concurrent command writes do not queue on one connection."""
+        with patch("httpx.Client") as sync_client:
+            AasRepositoryClient("http://repo", max_connections=4)
+
+        limits = sync_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 4
+        assert limits.keepalive_expiry == 300.0
@@ -0,0 +1,32 @@
+"""Unit tests for shared state database connection setup."""
+
+import sqlite3
+from pathlib import Path
+
+from aas_uns_bridge.state import AliasDB, BirthCache, LastPublishedHashes
+from aas_uns_bridge.state.db import connect
+
+
+def journal_mode(db_path: Path) -> str:
+    """Read the journal mode stored in a database file."""
+    with sqlite3.connect(db_path) as conn:
+        return str(conn.execute("PRAGMA journal_mode").fetchone()[0])
+
+
+class TestStateDatabases:
+    """Tests for SQLite tuning of the state stores."""
+
+    def test_connections_use_normal_sync(self, tmp_path: Path) -> None:
+        """Test that connections skip the per-commit fsync of FULL sync."""
+        with connect(tmp_path / "state.db") as conn:
+            # 1 == NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_stores_switch_to_wal(self, tmp_path: Path) -> None:
+        """Test that initializing a store persists WAL mode in its file."""
+        AliasDB(tmp_path / "aliases.db")
+        BirthCache(tmp_path / "births.db")
+        LastPublishedHashes(tmp_path / "hashes.db")
+
+        for name in ("aliases.db", "births.db", "hashes.db"):
+            assert journal_mode(tmp_path / name) == "wal"
@@ -1,9 +1,19 @@
 """Unit tests for AAS submodel traversal."""
 
+import sys
+
+import pytest
 from basyx.aas import model
 from basyx.aas.model.base import MultiLanguageTextType
 
-from aas_uns_bridge.aas.traversal import _ref_to_string, flatten_submodel, get_global_asset_id
+from aas_uns_bridge.aas import traversal
+from aas_uns_bridge.aas.traversal import (
+    _ref_to_string,
+    flatten_submodel,
+    get_global_asset_id,
+    iter_submodel_metrics,
+    iter_submodels,
+)
 
 
 def create_property(id_short: str, value: str, value_type: type = str) -> model.Property:
@@ -232,6 +242,35 @@ class TestFlattenSubmodel:
         assert count_metric.value_type == "xs:int"
         assert count_metric.value == 42
 
+    def test_explicit_timestamp_used(self) -> None:
+        """Test that a snapshot timestamp is applied to every metric."""
+        submodel = model.Submodel(
+            id_="https://example.com/sm/ts",
+            id_short="Test",
+            submodel_element=[create_property("A", "a"), create_range("R", 0.0, 1.0)],
+        )
+
+        metrics = flatten_submodel(submodel, timestamp_ms=1_700_000_000_000)
+
+        assert {m.timestamp_ms for m in metrics} == {1_700_000_000_000}
+
+    def test_value_type_lookup_memoized(self) -> None:
+        """Test that the XSD mapping is computed once per value type."""
+        traversal._xsd_type_for.cache_clear()
+        submodel = model.Submodel(
+            id_="https://example.com/sm/types",
+            id_short="Types",
+            submodel_element=[
+                model.Property(id_short=f"P{i}", value_type=model.datatypes.Long, value=i)
+                for i in range(5)
+            ],
+        )
+
+        metrics = flatten_submodel(submodel)
+
+        assert {m.value_type for m in metrics} == {"xs:long"}
+        assert traversal._xsd_type_for.cache_info().misses == 1
+
     def test_timestamp_set(self) -> None:
         """Test that timestamp is set on all metrics."""
         submodel = model.Submodel(
@@ -247,6 +286,144 @@ class TestFlattenSubmodel:
         assert len(metrics) == 1
         assert metrics[0].timestamp_ms > 0
 
+    def test_nesting_deeper_than_recursion_limit(self) -> None:
+        """Test that deeply nested collections are flattened without recursion."""
+        depth = sys.getrecursionlimit() + 100
+        element: model.SubmodelElement = create_property("Leaf", "deep")
+        for level in range(depth):
+            element = create_collection(f"L{level}", [element])
+        submodel = model.Submodel(
+            id_="https://example.com/sm/deep",
+            id_short="Deep",
+            submodel_element=[element],
+        )
+
+        metrics = flatten_submodel(submodel)
+
+        assert len(metrics) == 1
+        assert metrics[0].path.count(".") == depth + 1
+        assert metrics[0].path.endswith("L0.Leaf")
+
+
+class TestIterSubmodelMetrics:
+    """Tests for the streaming iter_submodel_metrics variant."""
+
+    def test_matches_flatten_submodel(self) -> None:
+        """Test that streamed metrics equal the eagerly flattened list."""
+        submodel = model.Submodel(
+            id_="https://example.com/sm/stream",
+            id_short="Stream",
+            submodel_element=[
+                create_collection(
+                    "Nested", [create_property("A", "a"), create_range("R", 1.0, 2.0)]
+                ),
+                model.SubmodelElementList(
+                    id_short="Items",
+                    type_value_list_element=model.Property,
+                    value_type_list_element=str,
+                    value=[model.Property(None, str, v) for v in ("x", "y")],
+                ),
+                model.Entity("Ent", model.EntityType.CO_MANAGED_ENTITY),
+                create_property("B", "b"),
+            ],
+        )
+
+        streamed = iter_submodel_metrics(submodel, timestamp_ms=1)
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == flatten_submodel(submodel, timestamp_ms=1)
+
+    def test_records_traversal_duration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that both variants observe one traversal duration per submodel."""
+        observed: list[float] = []
+        monkeypatch.setattr(traversal, "_observe_traversal", observed.append)
+        submodel = model.Submodel(
+            id_="https://example.com/sm/timed",
+            id_short="Timed",
+            submodel_element=[create_property("A", "a"), create_property("B", "b")],
+        )
+
+        flatten_submodel(submodel)
+        streamed = iter_submodel_metrics(submodel)
+        next(streamed)
+        assert len(observed) == 1
+        list(streamed)
+
+        assert len(observed) == 2
+
+    def test_duration_excludes_consumer_time(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that time spent between yielded metrics is not counted."""
+        observed: list[float] = []
+        monkeypatch.setattr(traversal, "_observe_traversal", observed.append)
+        clock = iter(range(100))
+        monkeypatch.setattr(traversal.time, "perf_counter", lambda: float(next(clock)))
+        submodel = model.Submodel(
+            id_="https://example.com/sm/slow",
+            id_short="Slow",
+            submodel_element=[create_property("A", "a"), create_property("B", "b")],
+        )
+
+        streamed = iter_submodel_metrics(submodel, timestamp_ms=1)
+        next(streamed)
+        for _ in range(10):
+            next(clock)  # the consumer takes its time
+        list(streamed)
+
+        # Three busy spans of one tick each, the 10 consumer ticks left out
+        assert observed == [3.0]
+
+
+class TestSemanticMetadata:
+    """Tests for semantic ID and unit extraction."""
+
+    @staticmethod
+    def global_ref(*values: str) -> model.ExternalReference:
+        """Build an external reference from key values."""
+        return model.ExternalReference(
+            tuple(model.Key(model.KeyTypes.GLOBAL_REFERENCE, v) for v in values)
+        )
+
+    def test_single_and_composite_semantic_keys(self) -> None:
+        """Test that all semantic keys are extracted, the first being primary."""
+        submodel = model.Submodel(
+            id_="https://example.com/sm/sem",
+            id_short="Sem",
+            submodel_element=[
+                model.Property("One", str, "a", semantic_id=self.global_ref("0173-1#02-A#001")),
+                model.Property("Two", str, "b", semantic_id=self.global_ref("urn:x", "urn:y")),
+                create_property("None", "c"),
+            ],
+        )
+
+        one, two, none = flatten_submodel(submodel)
+
+        assert (one.semantic_id, one.semantic_keys) == ("0173-1#02-A#001", ("0173-1#02-A#001",))
+        assert (two.semantic_id, two.semantic_keys) == ("urn:x", ("urn:x", "urn:y"))
+        assert (none.semantic_id, none.semantic_keys) == (None, ())
+
+    def test_unit_from_iec61360_specification(self) -> None:
+        """Test that the unit is read from an embedded IEC 61360 specification."""
+        spec = model.EmbeddedDataSpecification(
+            self.global_ref("https://admin-shell.io/DataSpecificationTemplates/IEC61360"),
+            model.DataSpecificationIEC61360(
+                preferred_name=model.PreferredNameTypeIEC61360({"en": "Temperature"}),
+                unit="degC",
+            ),
+        )
+        submodel = model.Submodel(
+            id_="https://example.com/sm/unit",
+            id_short="Unit",
+            submodel_element=[
+                model.Property("Temp", float, 1.0, embedded_data_specifications=[spec]),
+                model.Property("Plain", float, 2.0),
+            ],
+        )
+
+        temp, plain = flatten_submodel(submodel)
+
+        assert temp.unit == "degC"
+        assert plain.unit is None
+
 
 class TestGetGlobalAssetId:
     """Tests for get_global_asset_id function."""
@@ -291,6 +468,34 @@ class TestGetGlobalAssetId:
         assert asset_id is None
 
 
+class TestIterSubmodels:
+    """Tests for iter_submodels function."""
+
+    def test_submodels_paired_with_shell_asset_ids(self) -> None:
+        """Test that submodels get the asset ID of the shell referencing them."""
+        linked = model.Submodel(id_="https://example.com/sm/linked", id_short="Linked")
+        orphan = model.Submodel(id_="https://example.com/sm/orphan", id_short="Orphan")
+        aas = model.AssetAdministrationShell(
+            id_="https://example.com/aas/1",
+            asset_information=model.AssetInformation(
+                asset_kind=model.AssetKind.INSTANCE,
+                global_asset_id="https://example.com/asset/1",
+            ),
+            submodel={model.ModelReference.from_referable(linked)},
+        )
+        # Submodels stored before the shell that references them
+        store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore(
+            [linked, orphan, aas]
+        )
+
+        pairs = {sm.id: asset_id for sm, asset_id in iter_submodels(store)}
+
+        assert pairs == {
+            "https://example.com/sm/linked": "https://example.com/asset/1",
+            "https://example.com/sm/orphan": None,
+        }
+
+
 class TestReferenceElement:
     """Tests for ReferenceElement flattening."""
 
@@ -498,6 +703,48 @@ class TestRelationshipElement:
         assert len(metrics) == 1
         assert metrics[0].value == "SM1/PropA -> SM2/PropB"
 
+    def test_annotated_relationship_uses_relationship_handler(self) -> None:
+        """Test that subclasses are dispatched like their base type and memoized."""
+        ref = model.ModelReference(
+            key=(model.Key(model.KeyTypes.SUBMODEL, "SM1"),),
+            type_=model.Submodel,
+        )
+        submodel = model.Submodel(
+            id_="https://example.com/sm/rel",
+            id_short="Relations",
+            submodel_element=[
+                model.AnnotatedRelationshipElement(id_short="Link", first=ref, second=ref),
+            ],
+        )
+        traversal._HANDLERS.pop(model.AnnotatedRelationshipElement, None)
+
+        metrics = flatten_submodel(submodel)
+
+        assert [m.value for m in metrics] == ["SM1 -> SM1"]
+        assert traversal._HANDLERS[model.AnnotatedRelationshipElement] is (
+            traversal._emit_relationship
+        )
+
+    def test_file_subclass_skipped_and_memoized(self) -> None:
+        """Test that File subclasses are skipped without a handler call."""
+
+        class Attachment(model.File):
+            pass
+
+        submodel = model.Submodel(
+            id_="https://example.com/sm/attach",
+            id_short="Attachments",
+            submodel_element=[
+                Attachment(id_short="Manual", content_type="application/pdf"),
+                create_property("Kept", "yes"),
+            ],
+        )
+
+        metrics = flatten_submodel(submodel)
+
+        assert [m.path for m in metrics] == ["Attachments.Kept"]
+        assert traversal._HANDLERS[Attachment] is None
+
 
 class TestRefToString:
     """Tests for _ref_to_string helper function."""